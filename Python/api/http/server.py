@@ -11,6 +11,8 @@ from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse
 from typing import Optional
 
+from core.schemas.base import to_json
+
 # Import handlers to register routes
 from . import handlers  # This triggers @route decorators
 
@@ -89,7 +91,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
                 self.send_header('Content-Type', 'application/json')
                 self.end_headers()
                 error_response = {'error': f'File not found: {filename}'}
-                self.wfile.write(json.dumps(error_response).encode('utf-8'))
+                self.wfile.write(to_json(error_response))
                 return
 
             # Determine content type
@@ -116,7 +118,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
             self.send_header('Content-Type', 'application/json')
             self.end_headers()
             error_response = {'error': str(e)}
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self.wfile.write(to_json(error_response))
 
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
@@ -150,8 +152,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
                 self.send_header('Content-Type', 'application/json')
                 self.end_headers()
 
-                response_json = json.dumps(response, cls=SafeJSONEncoder)
-                self.wfile.write(response_json.encode('utf-8'))
+                self.wfile.write(to_json(response))
 
                 duration_ms = (time.time() - start_time) * 1000
                 log_request_end(trace_id, 200, duration_ms)
@@ -167,8 +168,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
                 self.send_header('Content-Type', 'application/json')
                 self.end_headers()
 
-                response_json = json.dumps(response, cls=SafeJSONEncoder)
-                self.wfile.write(response_json.encode('utf-8'))
+                self.wfile.write(to_json(response))
 
                 duration_ms = (time.time() - start_time) * 1000
                 log_request_end(trace_id, 200, duration_ms)
@@ -189,8 +189,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
                     log_error(trace_id, e, route_info['name'])
                     response = build_error_response(e, trace_id)
 
-                response_json = json.dumps(response, cls=SafeJSONEncoder)
-                self.wfile.write(response_json.encode('utf-8'))
+                self.wfile.write(to_json(response))
 
                 duration_ms = (time.time() - start_time) * 1000
                 log_request_end(trace_id, 200, duration_ms)
@@ -209,7 +208,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
             self.send_header('Content-Type', 'application/json')
             self.end_headers()
             error_response = {'error': f'Not found: {path}'}
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self.wfile.write(to_json(error_response))
 
         except Exception as e:
             logger.exception(f"[{trace_id}] Unexpected error in GET handler")
@@ -218,7 +217,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
             self.send_header('Content-Type', 'application/json')
             self.end_headers()
             error_response = build_error_response(e, trace_id)
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self.wfile.write(to_json(error_response))
 
     def do_POST(self):
         """
@@ -249,7 +248,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
             content_length = int(self.headers.get('Content-Length', 0))
             if content_length == 0:
                 error_response = {'error': 'No request data', 'trace_id': trace_id}
-                self.wfile.write(json.dumps(error_response).encode('utf-8'))
+                self.wfile.write(to_json(error_response))
                 return
 
             post_data = self.rfile.read(content_length)
@@ -313,8 +312,7 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
                 }
 
             # Send response
-            response_json = json.dumps(response, cls=SafeJSONEncoder)
-            self.wfile.write(response_json.encode('utf-8'))
+            self.wfile.write(to_json(response))
 
             # Log completion
             duration_ms = (time.time() - start_time) * 1000
@@ -324,12 +322,12 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
             error_msg = f"Invalid JSON: {e}"
             logger.error(f"[{trace_id}] {error_msg}")
             error_response = build_error_response(ValueError(error_msg), trace_id)
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self.wfile.write(to_json(error_response))
 
         except Exception as e:
             logger.exception(f"[{trace_id}] Unexpected error in POST handler")
             error_response = build_error_response(e, trace_id)
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self.wfile.write(to_json(error_response))
 
     def do_PUT(self):
         """Handle PUT requests (session name updates, etc.)"""
@@ -346,17 +344,6 @@ class HTTPBridgeHandler(BaseHTTPRequestHandler):
         original.do_DELETE()
 
 
-class SafeJSONEncoder(json.JSONEncoder):
-    """JSON encoder that safely handles bytes objects and other non-serializable types."""
-    def default(self, obj):
-        if isinstance(obj, bytes):
-            return f"<bytes:{len(obj)} bytes>"
-        elif hasattr(obj, '__dict__'):
-            return obj.__dict__
-        else:
-            return super().default(obj)
-
-
 class HTTPBridge:
     """HTTP Bridge Server for MCP communication."""
 
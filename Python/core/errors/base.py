@@ -67,32 +67,34 @@ class AppError(Exception):
         return self.message
 
     def to_response(self) -> Dict[str, Any]:
-        """Convert to HTTP response format."""
-        response = {
-            "success": False,
-            "status_code": self.status_code,
-            "error": {
-                "code": self.code,
-                "message": self.message,
-                "category": self.category.value,
-            }
+        """
+        Convert to HTTP response format.
+
+        Only populated optional fields are emitted, so the payload stays a
+        plain dict of JSON primitives with no null placeholders.
+        """
+        error = {
+            "code": self.code,
+            "message": self.message,
+            "category": self.category.value,
         }
-
         if self.details:
-            response["error"]["details"] = self.details
-
+            error["details"] = self.details
         if self.suggestion:
-            response["error"]["suggestion"] = self.suggestion
-
-        if self.retry_after:
-            response["error"]["retry_after"] = self.retry_after
+            error["suggestion"] = self.suggestion
+        if self.retry_after is not None:
+            error["retry_after"] = self.retry_after
+        if self.correlation_id:
+            error["correlation_id"] = self.correlation_id
 
+        response = {
+            "success": False,
+            "status_code": self.status_code,
+            "error": error
+        }
         if self.request_id:
             response["request_id"] = self.request_id
 
-        if self.correlation_id:
-            response["error"]["correlation_id"] = self.correlation_id
-
         return response
 
     def to_log(self) -> Dict[str, Any]:
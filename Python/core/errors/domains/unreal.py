@@ -1,8 +1,13 @@
 """Unreal Engine-specific error codes and exceptions."""
 
+import sys
 from ..base import AppError, ErrorCategory
 from typing import Optional
 
+# Names longer than this are not interned; hashing long strings into the
+# intern table costs more than the sharing saves.
+_INTERN_MAX_LENGTH = 128
+
 
 class UnrealErrorCodes:
     """Standardized error codes for Unreal Engine operations."""
@@ -59,6 +64,19 @@ class UnrealError(AppError):
         )
 
 
+def _intern_name(name):
+    """
+    Intern a short, recurring identifier (actor, asset or plugin name).
+
+    The same names come back across the app life-cycle, so interning lets the
+    resulting ``details`` dicts share one string object. Non-str values and
+    names of 128+ characters are returned unchanged.
+    """
+    if name.__class__ is str and len(name) < _INTERN_MAX_LENGTH:
+        return sys.intern(name)
+    return name
+
+
 # Helper functions for common Unreal errors
 
 def connection_failed(host: str = "localhost", port: int = 55557, request_id: Optional[str] = None) -> UnrealError:
@@ -100,6 +118,7 @@ def command_failed(command: str, reason: str, request_id: Optional[str] = None)
 
 def actor_not_found(actor_name: str, request_id: Optional[str] = None) -> UnrealError:
     """Create actor not found error."""
+    actor_name = _intern_name(actor_name)
     return UnrealError(
         code=UnrealErrorCodes.ACTOR_NOT_FOUND,
         message=f"Actor '{actor_name}' not found in level",
@@ -112,6 +131,7 @@ def actor_not_found(actor_name: str, request_id: Optional[str] = None) -> Unreal
 
 def asset_not_found(asset_path: str, request_id: Optional[str] = None) -> UnrealError:
     """Create asset not found error."""
+    asset_path = _intern_name(asset_path)
     return UnrealError(
         code=UnrealErrorCodes.ASSET_NOT_FOUND,
         message=f"Asset not found: {asset_path}",
@@ -136,6 +156,7 @@ def screenshot_failed(reason: str, resolution: Optional[str] = None, request_id:
 
 def plugin_not_found(plugin_name: str, request_id: Optional[str] = None) -> UnrealError:
     """Create plugin not found error."""
+    plugin_name = _intern_name(plugin_name)
     return UnrealError(
         code=UnrealErrorCodes.PLUGIN_NOT_FOUND,
         message=f"Plugin '{plugin_name}' not found or disabled",
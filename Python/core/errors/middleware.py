@@ -1,7 +1,6 @@
 """Error handling middleware for HTTP bridge."""
 
 import logging
-import functools
 from typing import Callable, Any
 from .base import AppError, ErrorCategory
 
@@ -21,7 +20,6 @@ def handle_request_errors(request_id_getter: Callable = None):
             ...
     """
     def decorator(handler_func):
-        @functools.wraps(handler_func)
         def wrapper(*args, **kwargs):
             request_id = None
             try:
@@ -55,5 +53,10 @@ def handle_request_errors(request_id_getter: Callable = None):
 
                 return error.to_response()
 
+        # Copy only the identity attributes; functools.wraps would also copy
+        # __doc__, __annotations__ and merge __dict__ for every endpoint.
+        wrapper.__name__ = handler_func.__name__
+        wrapper.__qualname__ = handler_func.__qualname__
+        wrapper.__wrapped__ = handler_func
         return wrapper
     return decorator
@@ -5,9 +5,10 @@ This module defines the core plugin architecture that enables modular tool integ
 for various creative applications (Unreal Engine, Nano Banana, Blender, etc.).
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -36,7 +37,7 @@ class ToolStatus(Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolMetadata:
     """Metadata describing a creative tool."""
     tool_id: str  # Unique identifier (e.g., "nano_banana", "unreal_engine")
@@ -48,9 +49,10 @@ class ToolMetadata:
     requires_connection: bool  # Whether tool needs external connection (TCP, API, etc.)
     icon: Optional[str] = None  # Icon identifier for UI
     pricing_tier: Optional[str] = None  # Pricing category if applicable
+    supported_commands: List[str] = field(default_factory=list)  # Commands routed to this tool
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Standardized command execution result."""
     success: bool
@@ -68,8 +70,19 @@ class BasePlugin(ABC):
 
     Each tool (Unreal Engine, Nano Banana, Blender, etc.) implements this interface
     to enable standardized integration with the Creative Hub system.
+
+    Subclasses declare the command types they handle in ``SUPPORTED_COMMANDS``
+    (any iterable of strings); it is frozen and interned once per class.
     """
 
+    SUPPORTED_COMMANDS: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        commands = cls.__dict__.get('SUPPORTED_COMMANDS')
+        if commands is not None:
+            cls.SUPPORTED_COMMANDS = frozenset(map(sys.intern, commands))
+
     def __init__(self):
         """Initialize the plugin."""
         self._metadata: Optional[ToolMetadata] = None
@@ -115,15 +128,14 @@ class BasePlugin(ABC):
         """
         pass
 
-    @abstractmethod
-    def get_supported_commands(self) -> List[str]:
+    def get_supported_commands(self) -> FrozenSet[str]:
         """
-        Return list of command types this tool can handle.
+        Return the command types this tool can handle.
 
         Returns:
-            List of command type strings (e.g., ["create_actor", "take_screenshot"])
+            Frozen set of command type strings (e.g., {"create_actor", "take_screenshot"})
         """
-        pass
+        return self.SUPPORTED_COMMANDS
 
     @abstractmethod
     def validate_command(self, command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -153,6 +165,31 @@ class BasePlugin(ABC):
         """
         pass
 
+    def execute_with_validation(self, command_type: str, params: Dict[str, Any]) -> CommandResult:
+        """
+        Validate and execute a command in one call.
+
+        The default runs validate_command then execute_command. Plugins whose
+        validation parses parameters expensively can override this to parse
+        once and reuse the result for execution.
+
+        Args:
+            command_type: Type of command to execute
+            params: Command parameters
+
+        Returns:
+            CommandResult with a VALIDATION_ERROR failure or the execution outcome
+        """
+        validation = self.validate_command(command_type, params)
+        if not validation.get('valid', False):
+            return CommandResult(
+                success=False,
+                error="Command validation failed",
+                error_code="VALIDATION_ERROR",
+                error_details={'errors': validation.get('errors', [])}
+            )
+        return self.execute_command(command_type, params)
+
     def get_status(self) -> ToolStatus:
         """
         Get current tool status.
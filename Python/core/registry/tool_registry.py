@@ -6,16 +6,32 @@ tool capabilities and command requirements.
 """
 
 import os
+import sys
 import json
+import hashlib
+import tempfile
 import importlib
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Type, Any
 from ..plugin_base import BasePlugin, ToolCapability, ToolStatus, ToolMetadata, CommandResult
 
+# orjson parses metadata noticeably faster; stdlib json accepts the same bytes input
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cache file layout changes to invalidate old caches
+_DISCOVERY_CACHE_VERSION = 1
+
 
 class ToolRegistry:
     """
@@ -28,18 +44,24 @@ class ToolRegistry:
     - Tool health monitoring
     """
 
-    def __init__(self, tools_directory: Optional[str] = None):
+    def __init__(self, tools_directory: Optional[str] = None, cache_path: Optional[str] = None):
         """
         Initialize the tool registry.
 
         Args:
             tools_directory: Path to tools directory (defaults to Python/tools/)
+            cache_path: Path to the discovery cache file
+                (defaults to ~/.cache/creative_hub/registry.json)
         """
         self._tools: Dict[str, BasePlugin] = {}  # tool_id -> plugin instance
         self._metadata: Dict[str, ToolMetadata] = {}  # tool_id -> metadata
+        self._metadata_view = MappingProxyType(self._metadata)  # read-only live view
         self._plugin_paths: Dict[str, Path] = {}  # tool_id -> plugin directory path
         self._command_map: Dict[str, str] = {}  # command_type -> tool_id
+        self._module_cache: Dict[str, Any] = {}  # tool_id -> imported plugin module
+        self._capability_index: Dict[ToolCapability, List[str]] = defaultdict(list)  # capability -> tool_ids
         self._tools_directory = tools_directory or self._get_default_tools_dir()
+        self._cache_path = cache_path or self._get_default_cache_path()
         self._initialized = False
 
     def _get_default_tools_dir(self) -> str:
@@ -48,6 +70,10 @@ class ToolRegistry:
         # From core/registry/tool_registry.py -> Python/tools/
         return str(current_file.parent.parent.parent / "tools")
 
+    def _get_default_cache_path(self) -> str:
+        """Get default discovery cache file path."""
+        return str(Path.home() / ".cache" / "creative_hub" / "registry.json")
+
     def discover_tools(self) -> List[str]:
         """
         Discover available tools by scanning for metadata.json files.
@@ -56,6 +82,10 @@ class ToolRegistry:
         - tools/nano_banana/metadata.json
         - tools/image_generation/nano_banana/metadata.json
 
+        Parsed metadata is cached on disk, keyed by a fingerprint of every
+        metadata.json path, mtime and size. When the fingerprint matches, the
+        cache is loaded in one read instead of parsing each file.
+
         Returns:
             List of discovered tool IDs
         """
@@ -66,44 +96,167 @@ class ToolRegistry:
             logger.warning(f"Tools directory not found: {self._tools_directory}")
             return discovered
 
-        # Recursively scan for metadata.json files (max 2 levels deep)
-        for metadata_path in tools_path.glob("*/metadata.json"):
-            self._load_tool_metadata(metadata_path, discovered)
+        # Scan for metadata.json files (max 2 levels deep)
+        metadata_files = self._scan_metadata_files(self._tools_directory)
 
-        for metadata_path in tools_path.glob("*/*/metadata.json"):
-            self._load_tool_metadata(metadata_path, discovered)
+        fingerprint = self._fingerprint_metadata(metadata_files)
+        cached_entries = self._read_discovery_cache(fingerprint)
+        if cached_entries is not None:
+            try:
+                for entry in cached_entries:
+                    self._register_metadata(entry['metadata'], Path(entry['plugin_dir']), discovered)
+            except Exception as e:
+                # The fingerprint only covers metadata.json files, so code
+                # changes (e.g. to ToolCapability) can invalidate the cache;
+                # discard it and rescan (re-registering is idempotent)
+                logger.warning(f"Discarding stale discovery cache: {e}")
+                discovered.clear()
+            else:
+                logger.debug(f"Loaded {len(discovered)} tools from discovery cache")
+                return discovered
+
+        # Read/parse files concurrently (I/O bound), then register serially
+        # in scan order so discovery order and override warnings are stable
+        metadata_paths = [metadata_path for metadata_path, _ in metadata_files]
+        if len(metadata_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(metadata_paths))) as executor:
+                parsed = list(executor.map(self._read_tool_metadata, metadata_paths))
+        else:
+            parsed = [self._read_tool_metadata(path) for path in metadata_paths]
+
+        entries = []
+        for metadata_path, metadata_dict in zip(metadata_paths, parsed):
+            if metadata_dict is None:
+                continue
+            plugin_dir = os.path.dirname(metadata_path)
+            try:
+                registered = self._register_metadata(metadata_dict, Path(plugin_dir), discovered)
+            except Exception as e:
+                logger.error(f"Error loading metadata from {metadata_path}: {e}")
+                continue
+            if registered:
+                entries.append({'metadata': metadata_dict, 'plugin_dir': plugin_dir})
 
+        self._write_discovery_cache(fingerprint, entries)
         return discovered
 
-    def _load_tool_metadata(self, metadata_path: Path, discovered: List[str]) -> None:
-        """Helper to load metadata from a metadata.json file."""
+    def _scan_metadata_files(self, tools_dir: str) -> List[Tuple[str, os.stat_result]]:
+        """
+        Find metadata.json files one and two levels below tools_dir.
+
+        Uses os.scandir so directory checks come from the listing itself, and
+        stats each candidate metadata.json once (EAFP instead of exists()).
+        The stat results are reused for the cache fingerprint.
+
+        Returns:
+            List of (metadata_path, stat_result), top-level tools first
+        """
+        top_level, nested = [], []
+        with os.scandir(tools_dir) as it:
+            subdirs = [entry.path for entry in it if entry.is_dir()]
+
+        for subdir in subdirs:
+            self._stat_metadata(subdir, top_level)
+            try:
+                with os.scandir(subdir) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            self._stat_metadata(entry.path, nested)
+            except OSError as e:
+                logger.debug(f"Could not scan {subdir}: {e}")
+
+        return top_level + nested
+
+    @staticmethod
+    def _stat_metadata(directory: str, found: List[Tuple[str, os.stat_result]]) -> None:
+        """Append (path, stat) for directory/metadata.json if it exists."""
+        metadata_path = os.path.join(directory, "metadata.json")
         try:
-            with open(metadata_path, 'r') as f:
-                metadata_dict = json.load(f)
-                tool_id = metadata_dict.get('tool_id')
-                if tool_id:
-                    # Parse capabilities from strings to enum
-                    capabilities = [
-                        ToolCapability(cap) for cap in metadata_dict.get('capabilities', [])
-                    ]
-                    metadata = ToolMetadata(
-                        tool_id=tool_id,
-                        display_name=metadata_dict.get('display_name', tool_id),
-                        version=metadata_dict.get('version', '0.0.0'),
-                        capabilities=capabilities,
-                        description=metadata_dict.get('description', ''),
-                        author=metadata_dict.get('author', 'Unknown'),
-                        requires_connection=metadata_dict.get('requires_connection', False),
-                        icon=metadata_dict.get('icon'),
-                        pricing_tier=metadata_dict.get('pricing_tier')
-                    )
-                    self._metadata[tool_id] = metadata
-                    # Store the plugin directory path for later loading
-                    self._plugin_paths[tool_id] = metadata_path.parent
-                    discovered.append(tool_id)
-                    logger.info(f"Discovered tool: {tool_id} ({metadata.display_name})")
+            found.append((metadata_path, os.stat(metadata_path)))
+        except OSError:
+            pass
+
+    def _fingerprint_metadata(self, metadata_files: List[Tuple[str, os.stat_result]]) -> str:
+        """Hash (path, mtime, size) of each metadata file."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(_DISCOVERY_CACHE_VERSION).encode())
+        for metadata_path, stat in sorted(metadata_files):
+            digest.update(f"{metadata_path}|{stat.st_mtime_ns}|{stat.st_size}\n".encode())
+        return digest.hexdigest()
+
+    def _read_discovery_cache(self, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached metadata entries if the cache matches the fingerprint."""
+        try:
+            with open(self._cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if cache.get('fingerprint') != fingerprint:
+            return None
+        return cache.get('tools')
+
+    def _write_discovery_cache(self, fingerprint: str, entries: List[Dict[str, Any]]) -> None:
+        """Atomically write the discovery cache (best effort)."""
+        try:
+            cache_dir = os.path.dirname(self._cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'fingerprint': fingerprint, 'tools': entries}, f)
+                os.replace(tmp_path, self._cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write discovery cache {self._cache_path}: {e}")
+
+    @staticmethod
+    def _read_tool_metadata(metadata_path: str) -> Optional[Dict[str, Any]]:
+        """Read and parse a metadata.json file; returns None on error."""
+        try:
+            with open(metadata_path, 'rb') as f:
+                return _json_loads(f.read())
         except Exception as e:
             logger.error(f"Error loading metadata from {metadata_path}: {e}")
+            return None
+
+    def _register_metadata(self, metadata_dict: Dict[str, Any], plugin_dir: Path, discovered: List[str]) -> bool:
+        """Build ToolMetadata from a parsed metadata dict and register it."""
+        tool_id = metadata_dict.get('tool_id')
+        if not tool_id:
+            return False
+        # Intern ids read from JSON so registry dict probes compare by identity
+        tool_id = sys.intern(tool_id)
+
+        # Parse capabilities from strings to enum
+        capabilities = [
+            ToolCapability(sys.intern(cap)) for cap in metadata_dict.get('capabilities', [])
+        ]
+        metadata = ToolMetadata(
+            tool_id=tool_id,
+            display_name=metadata_dict.get('display_name', tool_id),
+            version=metadata_dict.get('version', '0.0.0'),
+            capabilities=capabilities,
+            description=metadata_dict.get('description', ''),
+            author=metadata_dict.get('author', 'Unknown'),
+            requires_connection=metadata_dict.get('requires_connection', False),
+            icon=metadata_dict.get('icon'),
+            pricing_tier=metadata_dict.get('pricing_tier'),
+            supported_commands=[sys.intern(cmd) for cmd in metadata_dict.get('supported_commands', [])]
+        )
+        self._metadata[tool_id] = metadata
+        # Store the plugin directory path for later loading
+        self._plugin_paths[tool_id] = plugin_dir
+        for capability in capabilities:
+            if tool_id not in self._capability_index[capability]:
+                self._capability_index[capability].append(tool_id)
+        # Route declared commands without importing the plugin
+        for command in metadata.supported_commands:
+            self._map_command(command, tool_id)
+        discovered.append(tool_id)
+        logger.info(f"Discovered tool: {tool_id} ({metadata.display_name})")
+        return True
 
     def load_tool(self, tool_id: str) -> bool:
         """
@@ -123,21 +276,12 @@ class ToolRegistry:
             return False
 
         try:
-            # Get the plugin directory path (supports nested structures)
-            plugin_dir = self._plugin_paths.get(tool_id)
-            if not plugin_dir:
-                logger.error(f"Plugin path not found for tool: {tool_id}")
+            module = self._import_plugin_module(tool_id)
+            if module is None:
                 return False
 
-            # Build import path from plugin directory relative to tools/
-            tools_path = Path(self._tools_directory)
-            relative_path = plugin_dir.relative_to(tools_path)
-            module_path = f"tools.{'.'.join(relative_path.parts)}.plugin"
-
-            module = importlib.import_module(module_path)
-
             if not hasattr(module, 'Plugin'):
-                logger.error(f"Tool {tool_id} missing Plugin class in {module_path}")
+                logger.error(f"Tool {tool_id} missing Plugin class in {module.__name__}")
                 return False
 
             # Instantiate plugin
@@ -152,14 +296,14 @@ class ToolRegistry:
             # Register plugin
             self._tools[tool_id] = plugin
 
-            # Build command map
+            # Cross-check declared commands against what the plugin handles
+            declared = set(self._metadata[tool_id].supported_commands)
             for command in plugin.get_supported_commands():
-                if command in self._command_map:
+                if command not in declared:
                     logger.warning(
-                        f"Command '{command}' already mapped to {self._command_map[command]}, "
-                        f"overriding with {tool_id}"
+                        f"Command '{command}' handled by {tool_id} but missing from its metadata.json"
                     )
-                self._command_map[command] = tool_id
+                    self._map_command(command, tool_id)
 
             logger.info(f"Loaded tool: {tool_id}")
             return True
@@ -168,6 +312,43 @@ class ToolRegistry:
             logger.error(f"Error loading tool {tool_id}: {e}")
             return False
 
+    def _map_command(self, command: str, tool_id: str) -> None:
+        """Route a command type to a tool, warning when it overrides another tool."""
+        current = self._command_map.get(command)
+        if current is not None and current != tool_id:
+            logger.warning(
+                f"Command '{command}' already mapped to {current}, "
+                f"overriding with {tool_id}"
+            )
+        self._command_map[command] = tool_id
+
+    def _import_plugin_module(self, tool_id: str):
+        """
+        Import a tool's plugin module, reusing the module from earlier loads.
+
+        Plugins use package-relative imports, so they are imported by their
+        dotted name under ``tools``; the resolved module is cached per tool_id
+        so reloads after shutdown skip the import machinery entirely.
+        """
+        module = self._module_cache.get(tool_id)
+        if module is not None:
+            return module
+
+        # Get the plugin directory path (supports nested structures)
+        plugin_dir = self._plugin_paths.get(tool_id)
+        if not plugin_dir:
+            logger.error(f"Plugin path not found for tool: {tool_id}")
+            return None
+
+        # Build import path from plugin directory relative to tools/
+        tools_path = Path(self._tools_directory)
+        relative_path = plugin_dir.relative_to(tools_path)
+        module_path = f"tools.{'.'.join(relative_path.parts)}.plugin"
+
+        module = importlib.import_module(module_path)
+        self._module_cache[tool_id] = module
+        return module
+
     def initialize(self) -> bool:
         """
         Initialize the registry by discovering and optionally loading tools.
@@ -227,11 +408,7 @@ class ToolRegistry:
         Returns:
             List of tool IDs supporting this capability
         """
-        matching = []
-        for tool_id, metadata in self._metadata.items():
-            if capability in metadata.capabilities:
-                matching.append(tool_id)
-        return matching
+        return list(self._capability_index.get(capability, ()))
 
     def execute_command(self, command_type: str, params: Dict[str, Any]) -> CommandResult:
         """
@@ -252,19 +429,9 @@ class ToolRegistry:
                 error_code="TOOL_NOT_FOUND"
             )
 
-        # Validate command
-        validation = tool.validate_command(command_type, params)
-        if not validation.get('valid', False):
-            return CommandResult(
-                success=False,
-                error="Command validation failed",
-                error_code="VALIDATION_ERROR",
-                error_details={'errors': validation.get('errors', [])}
-            )
-
-        # Execute command
+        # Validate and execute in one plugin call
         try:
-            return tool.execute_command(command_type, params)
+            return tool.execute_with_validation(command_type, params)
         except Exception as e:
             logger.error(f"Error executing {command_type}: {e}")
             return CommandResult(
@@ -273,14 +440,15 @@ class ToolRegistry:
                 error_code="EXECUTION_ERROR"
             )
 
-    def get_all_metadata(self) -> Dict[str, ToolMetadata]:
+    def get_all_metadata(self) -> Mapping[str, ToolMetadata]:
         """
         Get metadata for all discovered tools.
 
         Returns:
-            Dict mapping tool_id to ToolMetadata
+            Read-only live mapping of tool_id to ToolMetadata
+            (wrap in dict() for a mutable snapshot)
         """
-        return self._metadata.copy()
+        return self._metadata_view
 
     def get_health_status(self) -> Dict[str, ToolStatus]:
         """
@@ -303,7 +471,6 @@ class ToolRegistry:
             except Exception as e:
                 logger.error(f"Error shutting down {tool_id}: {e}")
         self._tools.clear()
-        self._command_map.clear()
 
 
 # Global registry instance
@@ -2,65 +2,58 @@
 Core Resources Module
 
 Resource processing modules (images, videos, 3D objects, UIDs, etc.)
-"""
-
-# UID Management
-from .uid_manager import (
-    generate_image_uid,
-    generate_video_uid,
-    generate_object_uid as generate_object3d_uid,
-    add_uid_mapping,
-    get_uid_mapping,
-    get_children_by_parent_uid,
-    get_mappings_by_session_id,
-    delete_mappings_by_session_id,
-    get_latest_image_uid
-)
-
-# Image resources
-from .images import (
-    ImageProcessor,
-    process_main_image,
-    process_reference_images,
-    load_image_from_uid
-)
 
-# Video resources
-from .videos import (
-    VideoProcessor,
-    process_video,
-    load_video_from_uid
-)
+Submodules are imported lazily (PEP 562) on first attribute access, so
+importing ``core.resources`` does not pull in the media processors until
+one of their names is actually used.
+"""
 
-# 3D object resources
-from .objects_3d import (
-    Object3DProcessor,
-    process_3d_object,
-    load_3d_object_from_uid
-)
+import importlib
 
-__all__ = [
+# Public name -> (submodule, attribute in that submodule)
+_LAZY_ATTRS = {
     # UID Management
-    'generate_image_uid',
-    'generate_video_uid',
-    'generate_object3d_uid',
-    'add_uid_mapping',
-    'get_uid_mapping',
-    'get_children_by_parent_uid',
-    'get_mappings_by_session_id',
-    'delete_mappings_by_session_id',
-    'get_latest_image_uid',
+    'generate_image_uid': ('.uid_manager', 'generate_image_uid'),
+    'generate_image_uids': ('.uid_manager', 'generate_image_uids'),
+    'generate_video_uid': ('.uid_manager', 'generate_video_uid'),
+    'generate_object3d_uid': ('.uid_manager', 'generate_object_uid'),
+    'add_uid_mapping': ('.uid_manager', 'add_uid_mapping'),
+    'add_uid_mappings': ('.uid_manager', 'add_uid_mappings'),
+    'get_uid_mapping': ('.uid_manager', 'get_uid_mapping'),
+    'get_children_by_parent_uid': ('.uid_manager', 'get_children_by_parent_uid'),
+    'get_mappings_by_session_id': ('.uid_manager', 'get_mappings_by_session_id'),
+    'delete_mappings_by_session_id': ('.uid_manager', 'delete_mappings_by_session_id'),
+    'get_latest_image_uid': ('.uid_manager', 'get_latest_image_uid'),
     # Images
-    'ImageProcessor',
-    'process_main_image',
-    'process_reference_images',
-    'load_image_from_uid',
+    'ImageProcessor': ('.images', 'ImageProcessor'),
+    'process_main_image': ('.images', 'process_main_image'),
+    'process_reference_images': ('.images', 'process_reference_images'),
+    'load_image_from_uid': ('.images', 'load_image_from_uid'),
     # Videos
-    'VideoProcessor',
-    'process_video',
-    'load_video_from_uid',
+    'VideoProcessor': ('.videos', 'VideoProcessor'),
+    'process_video': ('.videos', 'process_video'),
+    'load_video_from_uid': ('.videos', 'load_video_from_uid'),
     # 3D Objects
-    'Object3DProcessor',
-    'process_3d_object',
-    'load_3d_object_from_uid'
-]
+    'Object3DProcessor': ('.objects_3d', 'Object3DProcessor'),
+    'process_3d_object': ('.objects_3d', 'process_3d_object'),
+    'load_3d_object_from_uid': ('.objects_3d', 'load_3d_object_from_uid'),
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """Resolve a public name by importing its submodule on first access."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache in module globals so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
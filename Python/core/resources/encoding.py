@@ -0,0 +1,22 @@
+"""
+Shared helpers for base64-encoded resource payloads.
+"""
+
+# Characters the decoder skips (e.g. in MIME-wrapped input)
+BASE64_WHITESPACE = ('\n', '\r', ' ', '\t')
+
+
+def estimate_base64_decoded_size(b64_str: str, start: int = 0) -> int:
+    """
+    Estimate the decoded byte size of b64_str[start:] without decoding it.
+
+    Whitespace is not counted as payload and padding is read from the
+    whitespace-stripped tail, so the estimate never exceeds the decoded
+    size and size checks made with it never reject valid input.
+    """
+    end = len(b64_str)
+    chars = end - start
+    for ws in BASE64_WHITESPACE:
+        chars -= b64_str.count(ws, start)
+    padding = b64_str[max(start, end - 8):].rstrip()[-2:].count('=')
+    return (chars * 3) // 4 - padding
@@ -10,12 +10,69 @@ Copyright Policy:
 
 import base64
 import logging
-import re
+import os
+import threading
+from collections import OrderedDict
+from binascii import a2b_base64 as _b64decode
 from typing import Dict, Any, Optional, Tuple, List
 from pathlib import Path
 
+from core.resources.encoding import estimate_base64_decoded_size
+
 logger = logging.getLogger("UnrealMCP.Resources.Images")
 
+_ALLOWED_MIME_TYPES = frozenset({'image/png', 'image/jpeg', 'image/jpg'})
+
+_DATA_URI_PREFIX = "data:"
+_BASE64_MARKER = ";base64,"
+
+_get_uid_mapping = None
+
+# LRU of UID image bytes, validated against file mtime/size on every hit
+# uid -> (file_path, mtime_ns, size, bytes)
+_UID_CACHE: "OrderedDict[str, Tuple[str, int, int, bytes]]" = OrderedDict()
+_UID_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_uid_cache_bytes = 0
+_uid_cache_lock = threading.Lock()
+
+
+def _uid_mapping():
+    """Resolve uid_manager.get_uid_mapping once (deferred to avoid circular imports)."""
+    global _get_uid_mapping
+    if _get_uid_mapping is None:
+        from core.resources.uid_manager import get_uid_mapping
+        _get_uid_mapping = get_uid_mapping
+    return _get_uid_mapping
+
+
+def _cache_get(uid: str, file_path: str, stat: os.stat_result) -> Optional[bytes]:
+    """Return cached bytes for uid if the file is unchanged since it was cached."""
+    with _uid_cache_lock:
+        entry = _UID_CACHE.get(uid)
+        if entry is None:
+            return None
+        cached_path, mtime_ns, size, data = entry
+        if cached_path != file_path or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+        _UID_CACHE.move_to_end(uid)
+        return data
+
+
+def _cache_put(uid: str, file_path: str, stat: os.stat_result, data: bytes) -> None:
+    """Insert image bytes, evicting least recently used entries over budget."""
+    global _uid_cache_bytes
+    if len(data) > _UID_CACHE_MAX_BYTES:
+        return
+    with _uid_cache_lock:
+        old = _UID_CACHE.pop(uid, None)
+        if old is not None:
+            _uid_cache_bytes -= len(old[3])
+        while _UID_CACHE and _uid_cache_bytes + len(data) > _UID_CACHE_MAX_BYTES:
+            _, evicted = _UID_CACHE.popitem(last=False)
+            _uid_cache_bytes -= len(evicted[3])
+        _UID_CACHE[uid] = (file_path, stat.st_mtime_ns, stat.st_size, data)
+        _uid_cache_bytes += len(data)
+
 
 class ImageProcessor:
     """
@@ -29,7 +86,8 @@ class ImageProcessor:
 
     # Image constraints
     MAX_IMAGE_SIZE_MB = 10
-    ALLOWED_MIME_TYPES = {'image/png', 'image/jpeg', 'image/jpg'}
+    _MAX_IMAGE_SIZE_BYTES = MAX_IMAGE_SIZE_MB * 1024 * 1024
+    ALLOWED_MIME_TYPES = _ALLOWED_MIME_TYPES
 
     @classmethod
     def decode_base64_image(cls, data_str: str) -> Dict[str, Any]:
@@ -46,24 +104,45 @@ class ImageProcessor:
         Raises:
             ValueError: Invalid format or unsupported type
         """
-        # Try Data URI format
-        match = re.match(r"^data:(image/[\w]+);base64,(.*)", data_str)
-        if match:
-            mime_type, b64_data = match.groups()
-
-            if mime_type not in cls.ALLOWED_MIME_TYPES:
+        # Try Data URI format (prefix check + find; avoids running a regex
+        # over the whole payload)
+        if data_str.startswith(_DATA_URI_PREFIX):
+            marker = data_str.find(_BASE64_MARKER, len(_DATA_URI_PREFIX))
+            if marker == -1:
+                raise ValueError("Invalid data URI: missing ';base64,' marker")
+            mime_type = data_str[len(_DATA_URI_PREFIX):marker]
+            b64_data = data_str[marker + len(_BASE64_MARKER):]
+
+            if mime_type not in _ALLOWED_MIME_TYPES:
                 raise ValueError(
                     f"Unsupported image type: {mime_type}. "
-                    f"Allowed: {cls.ALLOWED_MIME_TYPES}"
+                    f"Allowed: {', '.join(sorted(_ALLOWED_MIME_TYPES))}"
                 )
 
-            decoded_data = base64.b64decode(b64_data)
+            cls._check_encoded_size(b64_data)
+            decoded_data = _b64decode(b64_data)
             return {"mime_type": mime_type, "data": decoded_data}
 
         # Fallback: raw base64 (assume PNG)
-        decoded_data = base64.b64decode(data_str)
+        cls._check_encoded_size(data_str)
+        decoded_data = _b64decode(data_str)
         return {"mime_type": "image/png", "data": decoded_data}
 
+    @classmethod
+    def _check_encoded_size(cls, b64_str: str) -> None:
+        """
+        Reject oversized payloads before decoding.
+
+        Raises:
+            ValueError: If the estimated decoded size exceeds MAX_IMAGE_SIZE_MB
+        """
+        estimated = estimate_base64_decoded_size(b64_str)
+        if estimated > cls._MAX_IMAGE_SIZE_BYTES:
+            raise ValueError(
+                f"Image too large: ~{estimated / (1024 * 1024):.2f}MB "
+                f"(max: {cls.MAX_IMAGE_SIZE_MB}MB)"
+            )
+
     @classmethod
     def validate_image_size(cls, image_data: bytes, max_size_mb: int = None) -> None:
         """
@@ -72,12 +151,13 @@ class ImageProcessor:
         Raises:
             ValueError: If image exceeds limit
         """
-        max_size = max_size_mb or cls.MAX_IMAGE_SIZE_MB
-        size_mb = len(image_data) / (1024 * 1024)
+        size = len(image_data)
+        limit = max_size_mb * 1024 * 1024 if max_size_mb else cls._MAX_IMAGE_SIZE_BYTES
 
-        if size_mb > max_size:
+        if size > limit:
+            max_size = max_size_mb or cls.MAX_IMAGE_SIZE_MB
             raise ValueError(
-                f"Image too large: {size_mb:.2f}MB (max: {max_size}MB)"
+                f"Image too large: {size / (1024 * 1024):.2f}MB (max: {max_size}MB)"
             )
 
     @classmethod
@@ -188,17 +268,21 @@ class ImageProcessor:
         if not reference_images_request:
             return []
 
+        # Bind hot callables once; the loop is kept (not a comprehension) so
+        # failures still report the offending reference index
+        decode = cls.decode_base64_image
+        validate = cls.validate_image_size
         processed_refs = []
+        append = processed_refs.append
 
         for i, ref_img in enumerate(reference_images_request):
             try:
-                image_data = cls.decode_base64_image(ref_img['data'])
-                cls.validate_image_size(image_data['data'])
-                processed_refs.append(image_data)
-
+                image_data = decode(ref_img['data'])
+                validate(image_data['data'])
             except Exception as e:
                 logger.error(f"Failed to process reference image {i}: {e}")
                 raise ValueError(f"Reference image {i} validation failed: {e}")
+            append(image_data)
 
         logger.info(
             f"Processed {len(processed_refs)} reference images "
@@ -220,18 +304,7 @@ class ImageProcessor:
         Raises:
             ValueError: UID not found or file missing
         """
-        # Import here to avoid circular imports
-        import sys
-        from pathlib import Path
-
-        # Add Python directory to path if needed
-        python_dir = Path(__file__).parent.parent.parent.parent
-        if str(python_dir) not in sys.path:
-            sys.path.insert(0, str(python_dir))
-
-        from core.resources.uid_manager import get_uid_mapping
-
-        mapping = get_uid_mapping(uid)
+        mapping = _uid_mapping()(uid)
         if not mapping:
             raise ValueError(f"Image UID not found: {uid}")
 
@@ -240,13 +313,16 @@ class ImageProcessor:
             raise ValueError(f"No file path in UID mapping: {uid}")
 
         file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             raise ValueError(f"Image file not found: {file_path}")
 
-        with open(file_path, 'rb') as f:
-            image_bytes = f.read()
-
-        logger.info(f"Loaded image from UID {uid}: {file_path.name}")
+        image_bytes = _cache_get(uid, str(file_path), stat)
+        if image_bytes is None:
+            image_bytes = file_path.read_bytes()
+            _cache_put(uid, str(file_path), stat, image_bytes)
+            logger.info(f"Loaded image from UID {uid}: {file_path.name}")
 
         return {
             'data': image_bytes,
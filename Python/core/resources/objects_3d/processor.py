@@ -8,13 +8,18 @@ Copyright Policy:
 - Generated 3D objects: PERSISTENT with UID assignment
 """
 
-import base64
 import logging
+from binascii import a2b_base64 as _b64decode
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger("UnrealMCP.Resources.Objects3D")
 
+_ALLOWED_FORMATS = frozenset({
+    'fbx', 'obj', 'gltf', 'glb', 'stl',
+    'blend', 'dae', 'uasset'  # Unreal assets
+})
+
 
 class Object3DProcessor:
     """
@@ -28,10 +33,8 @@ class Object3DProcessor:
 
     # 3D object constraints
     MAX_OBJECT_SIZE_MB = 50
-    ALLOWED_FORMATS = {
-        'fbx', 'obj', 'gltf', 'glb', 'stl',
-        'blend', 'dae', 'uasset'  # Unreal assets
-    }
+    _MAX_OBJECT_SIZE_BYTES = MAX_OBJECT_SIZE_MB * 1024 * 1024
+    ALLOWED_FORMATS = _ALLOWED_FORMATS
 
     @classmethod
     def decode_base64_object(cls, data_str: str, format: str = 'fbx') -> Dict[str, Any]:
@@ -49,13 +52,13 @@ class Object3DProcessor:
             ValueError: Invalid format or unsupported type
         """
         format = format.lower()
-        if format not in cls.ALLOWED_FORMATS:
+        if format not in _ALLOWED_FORMATS:
             raise ValueError(
                 f"Unsupported 3D format: {format}. "
-                f"Allowed: {cls.ALLOWED_FORMATS}"
+                f"Allowed: {', '.join(sorted(_ALLOWED_FORMATS))}"
             )
 
-        decoded_data = base64.b64decode(data_str)
+        decoded_data = _b64decode(data_str)
         return {"format": format, "data": decoded_data}
 
     @classmethod
@@ -66,12 +69,13 @@ class Object3DProcessor:
         Raises:
             ValueError: If object exceeds limit
         """
-        max_size = max_size_mb or cls.MAX_OBJECT_SIZE_MB
-        size_mb = len(object_data) / (1024 * 1024)
+        size = len(object_data)
+        limit = max_size_mb * 1024 * 1024 if max_size_mb else cls._MAX_OBJECT_SIZE_BYTES
 
-        if size_mb > max_size:
+        if size > limit:
+            max_size = max_size_mb or cls.MAX_OBJECT_SIZE_MB
             raise ValueError(
-                f"3D object too large: {size_mb:.2f}MB (max: {max_size}MB)"
+                f"3D object too large: {size / (1024 * 1024):.2f}MB (max: {max_size}MB)"
             )
 
 
@@ -8,17 +8,130 @@ Provides:
 - Continuous UID generation across server restarts
 """
 
+import os
 import json
+import hashlib
+import atexit
 import logging
+import struct
 import time
 import threading
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict, List, Any
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Mapping
 from core.utils.path_manager import get_path_manager
 
 logger = logging.getLogger("UnrealMCP")
 
+# orjson encodes/decodes the state several times faster than stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+# Bump when the snapshot layout changes; 2 = every mapping has session_id
+_STATE_SCHEMA_VERSION = 2
+
+# counters.bin layout: img, vid, obj, fbx counters as little-endian uint32
+_COUNTERS_STRUCT = struct.Struct('<IIII')
+
+# Journal counter record name -> UIDManager attribute
+_COUNTER_ATTRS = {
+    'img_counter': '_img_counter',
+    'vid_counter': '_vid_counter',
+    'obj_counter': '_obj_counter',
+    'fbx_counter': '_fbx_counter',
+}
+
+
+def _format_uid(prefix: str, number: int) -> str:
+    """Format a sequential UID: zero-padded to 3 digits, wider past 999 (img_042, img_1042)."""
+    return prefix + str(number).zfill(3)
+
+
+def _uid_number(uid: str) -> int:
+    """Numeric suffix of a sequential UID (img_042 -> 42), or -1 if it has none."""
+    suffix = uid[uid.find('_') + 1:]
+    return int(suffix) if suffix.isdigit() else -1
+
+
+class _RWLock:
+    """Writer-preferring readers-writer lock.
+
+    ``with lock:`` takes the exclusive side, so it drops in for a
+    threading.Lock; ``with lock.read_lock():`` takes the shared side.
+    Neither side is reentrant.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        self._read_side = _ReadSide(self)
+
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire(self) -> None:
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+
+    def release(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    def read_lock(self) -> "_ReadSide":
+        return self._read_side
+
+    def __enter__(self) -> "_RWLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class _ReadSide:
+    """Context manager for the shared side of an _RWLock."""
+
+    __slots__ = ('_rwlock',)
+
+    def __init__(self, rwlock: _RWLock):
+        self._rwlock = rwlock
+
+    def __enter__(self) -> None:
+        self._rwlock.acquire_read()
+
+    def __exit__(self, *exc) -> None:
+        self._rwlock.release_read()
+
 
 class UIDManager:
     """Enhanced UID manager with separate counters and mapping table.
@@ -26,10 +139,24 @@ class UIDManager:
     Features:
     - Separate counters for images (img_XXX) and videos (vid_XXX)
     - UID-to-file mapping with parent-child relationships
-    - Thread-safe for concurrent access
+    - Thread-safe for concurrent access (lookups share a readers-writer lock)
     - Atomic file operations for reliability
+    - Append-only journal: each mapping change appends one NDJSON record to
+      <storage>.log; the snapshot is only rewritten on compaction
+    - Counters persist separately as a fixed 16-byte counters.bin record
     """
 
+    # Debounce window for coalescing bursts of journal writes
+    FLUSH_INTERVAL = 0.05
+    # Write + fsync the journal inline once this many records are queued
+    JOURNAL_FSYNC_EVERY = 32
+    # Rewrite the snapshot once the journal holds this many records
+    COMPACT_THRESHOLD = 1000
+    # Upper bound for the backoff between retries of a failed compaction
+    COMPACT_RETRY_MAX = 30.0
+    # Indent the snapshot for manual inspection (larger and slower to write)
+    PRETTY_STATE = False
+
     def __init__(self, storage_file: str = None):
         # Use PathManager for centralized UID storage path
         if storage_file is None:
@@ -37,29 +164,54 @@ class UIDManager:
             uid_storage_dir = path_manager.get_uid_storage_path()
             storage_file = str(Path(uid_storage_dir) / "uid_state.json")
         self._storage_file = Path(storage_file)
+        self._journal_file = self._storage_file.with_suffix('.log')
+        self._counters_file = self._storage_file.parent / 'counters.bin'
         self._img_counter = 0
         self._vid_counter = 0
         self._obj_counter = 0  # New counter for 3D objects (OBJ format)
         self._fbx_counter = 0  # New counter for FBX format 3D objects
         self._uid_mappings = {}
-        self._lock = threading.Lock()
+        # Secondary indices: session_id / parent_uid -> {uid: None}
+        # (dict used as an insertion-ordered set so results keep creation order)
+        self._by_session: Dict[Optional[str], Dict[str, None]] = {}
+        self._by_parent: Dict[Optional[str], Dict[str, None]] = {}
+        # content type -> newest UID of that type (highest numeric suffix)
+        self._latest_by_type: Dict[str, str] = {}
+        self._lock = _RWLock()  # Shared for lookups, exclusive for mutation
         self._initialized = False
+        self._journal = None  # Opened lazily in append mode, kept open
+        self._journal_records = 0  # Records since last compaction
+        self._pending_records: List[bytes] = []  # Encoded, not yet written
+        self._counters_fh = None  # counters.bin, opened lazily and kept open
+        self._counters_unsynced = False
+        self._last_state_hash: Optional[bytes] = None  # Digest of the snapshot on disk
+        self._compact_pending = False
+        self._compact_retry_delay = 0.0  # Backoff after a failed snapshot write
+        self._dirty = threading.Event()
+        self._io_lock = threading.Lock()  # Serializes fsync/compaction
+        self._flush_thread: Optional[threading.Thread] = None
     
+    def _ensure_loaded(self) -> None:
+        """Load persisted state on first use (double-checked; lock-free once loaded)."""
+        if self._initialized:
+            return
+        with self._lock:
+            if not self._initialized:
+                self._load_state()
+                self._initialized = True
+
     def get_next_image_uid(self) -> str:
         """Generate next sequential image UID (e.g., img_043).
 
         Returns:
             Sequential image UID string in format img_XXX
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-
             self._img_counter += 1
-            self._save_state()
+            self._write_counters()
 
-            uid = f"img_{self._img_counter:03d}"
+            uid = _format_uid('img_', self._img_counter)
             logger.info(f"Generated image UID: {uid}")
             return uid
 
@@ -69,15 +221,12 @@ class UIDManager:
         Returns:
             Sequential video UID string in format vid_XXX
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-
             self._vid_counter += 1
-            self._save_state()
+            self._write_counters()
 
-            uid = f"vid_{self._vid_counter:03d}"
+            uid = _format_uid('vid_', self._vid_counter)
             logger.info(f"Generated video UID: {uid}")
             return uid
 
@@ -87,15 +236,12 @@ class UIDManager:
         Returns:
             Sequential object UID string in format obj_XXX
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-
             self._obj_counter += 1
-            self._save_state()
+            self._write_counters()
 
-            uid = f"obj_{self._obj_counter:03d}"
+            uid = _format_uid('obj_', self._obj_counter)
             logger.info(f"Generated OBJ UID: {uid}")
             return uid
 
@@ -105,15 +251,12 @@ class UIDManager:
         Returns:
             Sequential FBX UID string in format fbx_XXX
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-
             self._fbx_counter += 1
-            self._save_state()
+            self._write_counters()
 
-            uid = f"fbx_{self._fbx_counter:03d}"
+            uid = _format_uid('fbx_', self._fbx_counter)
             logger.info(f"Generated FBX UID: {uid}")
             return uid
 
@@ -123,10 +266,9 @@ class UIDManager:
         Returns:
             Dictionary with all counter values
         """
-        with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
+        self.flush()
+        self._ensure_loaded()
+        with self._lock.read_lock():
             return {
                 'img_counter': self._img_counter,
                 'vid_counter': self._vid_counter,
@@ -134,6 +276,28 @@ class UIDManager:
                 'fbx_counter': self._fbx_counter
             }
 
+    def get_next_image_uids(self, count: int) -> List[str]:
+        """Reserve a contiguous range of image UIDs in one operation.
+
+        Args:
+            count: Number of UIDs to generate
+
+        Returns:
+            List of sequential image UIDs (e.g., [img_044, img_045])
+        """
+        if count <= 0:
+            return []
+
+        self._ensure_loaded()
+        with self._lock:
+            start = self._img_counter + 1
+            self._img_counter += count
+            self._write_counters()
+
+            uids = [_format_uid('img_', n) for n in range(start, self._img_counter + 1)]
+            logger.info(f"Generated {count} image UIDs: {uids[0]}..{uids[-1]}")
+            return uids
+
     def add_mapping(self, uid: str, content_type: str, filename: str,
                    parent_uid: Optional[str] = None, session_id: Optional[str] = None,
                    metadata: Optional[Dict[str, Any]] = None) -> None:
@@ -147,21 +311,43 @@ class UIDManager:
             session_id: Optional session ID for batch cleanup
             metadata: Optional additional metadata
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
+            self._add_mapping_locked(uid, content_type, filename, parent_uid, session_id, metadata)
 
-            self._uid_mappings[uid] = {
-                'type': content_type,
-                'filename': filename,
-                'parent_uid': parent_uid,
-                'session_id': session_id,
-                'created_at': datetime.now().isoformat(),
-                'metadata': metadata or {}
-            }
-            self._save_state()
-            logger.info(f"Added mapping: {uid} -> {filename} (session: {session_id})")
+    def add_mappings(self, entries: List[Dict[str, Any]]) -> None:
+        """Add several UID-to-file mappings under a single lock acquisition.
+
+        Args:
+            entries: Dicts with add_mapping keyword arguments
+                (uid, content_type, filename and optionally parent_uid,
+                session_id, metadata)
+        """
+        self._ensure_loaded()
+        with self._lock:
+            for entry in entries:
+                self._add_mapping_locked(**entry)
+
+    def _add_mapping_locked(self, uid: str, content_type: str, filename: str,
+                            parent_uid: Optional[str] = None, session_id: Optional[str] = None,
+                            metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Insert one mapping and its index/journal entries (caller holds _lock)."""
+        mapping = {
+            'type': content_type,
+            'filename': filename,
+            'parent_uid': parent_uid,
+            'session_id': session_id,
+            'created_at_ms': int(time.time() * 1000),  # Epoch ms; older entries have ISO 'created_at'
+            'metadata': metadata or {}
+        }
+        previous = self._uid_mappings.get(uid)
+        if previous is not None:
+            self._unindex_mapping(uid, previous)
+        self._uid_mappings[uid] = mapping
+        self._index_mapping(uid, mapping)
+        self._track_latest(uid, content_type)
+        self._append_journal({'op': 'add', 'uid': uid, 'mapping': mapping})
+        logger.info(f"Added mapping: {uid} -> {filename} (session: {session_id})")
 
     def get_mapping(self, uid: str) -> Optional[Dict[str, Any]]:
         """Get mapping information for a UID.
@@ -172,11 +358,10 @@ class UIDManager:
         Returns:
             Mapping dictionary or None if not found
         """
-        with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-            return self._uid_mappings.get(uid)
+        # Lock-free once loaded: a single dict.get is atomic, and entries are
+        # replaced on update rather than mutated in place
+        self._ensure_loaded()
+        return self._uid_mappings.get(uid)
 
     def get_children_by_parent_uid(self, parent_uid: str) -> List[Dict[str, Any]]:
         """Get all child mappings for a given parent UID.
@@ -187,18 +372,13 @@ class UIDManager:
         Returns:
             List of child mapping dictionaries
         """
-        with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-
-            children = []
-            for uid, mapping in self._uid_mappings.items():
-                if mapping.get('parent_uid') == parent_uid:
-                    child_info = mapping.copy()
-                    child_info['uid'] = uid
-                    children.append(child_info)
-            return children
+        self._ensure_loaded()
+        with self._lock.read_lock():
+            mappings = self._uid_mappings
+            return [
+                {**mappings[uid], 'uid': uid}
+                for uid in self._by_parent.get(parent_uid, ())
+            ]
 
     def get_mappings_by_session_id(self, session_id: str) -> List[Dict[str, Any]]:
         """Get all UID mappings for a specific session.
@@ -209,18 +389,13 @@ class UIDManager:
         Returns:
             List of mapping dictionaries with UID included
         """
-        with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-
-            session_mappings = []
-            for uid, mapping in self._uid_mappings.items():
-                if mapping.get('session_id') == session_id:
-                    mapping_with_uid = mapping.copy()
-                    mapping_with_uid['uid'] = uid
-                    session_mappings.append(mapping_with_uid)
-            return session_mappings
+        self._ensure_loaded()
+        with self._lock.read_lock():
+            mappings = self._uid_mappings
+            return [
+                {**mappings[uid], 'uid': uid}
+                for uid in self._by_session.get(session_id, ())
+            ]
 
     def delete_mappings_by_session_id(self, session_id: str) -> List[str]:
         """Delete all UID mappings for a specific session.
@@ -231,64 +406,99 @@ class UIDManager:
         Returns:
             List of deleted UIDs
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
+            deleted_uids = list(self._by_session.pop(session_id, ()))
+            stale_types = set()
 
-            deleted_uids = []
-            uids_to_delete = [
-                uid for uid, mapping in self._uid_mappings.items()
-                if mapping.get('session_id') == session_id
-            ]
+            for uid in deleted_uids:
+                mapping = self._uid_mappings.pop(uid)
+                self._unindex_parent(uid, mapping)
+                if self._latest_by_type.get(mapping.get('type')) == uid:
+                    stale_types.add(mapping.get('type'))
+                self._append_journal({'op': 'delete', 'uid': uid})
 
-            for uid in uids_to_delete:
-                del self._uid_mappings[uid]
-                deleted_uids.append(uid)
+            for content_type in stale_types:
+                self._recompute_latest(content_type)
 
             if deleted_uids:
-                self._save_state()
                 logger.info(f"Deleted {len(deleted_uids)} mappings for session {session_id}: {deleted_uids}")
 
             return deleted_uids
 
-    def get_all_mappings(self) -> Dict[str, Dict[str, Any]]:
-        """Get all UID mappings.
+    def delete_mapping(self, uid: str) -> bool:
+        """Delete a single UID mapping.
+
+        Args:
+            uid: Unique identifier to delete
 
         Returns:
-            Dictionary of all UID mappings
+            True if the mapping existed and was deleted
         """
+        self._ensure_loaded()
         with self._lock:
-            if not self._initialized:
-                self._load_state()
-                self._initialized = True
-            return self._uid_mappings.copy()
+            mapping = self._uid_mappings.pop(uid, None)
+            if mapping is None:
+                return False
+            self._unindex_mapping(uid, mapping)
+            if self._latest_by_type.get(mapping.get('type')) == uid:
+                self._recompute_latest(mapping.get('type'))
+            self._append_journal({'op': 'delete', 'uid': uid})
+            return True
+
+    def get_latest_uid(self, content_type: str) -> Optional[str]:
+        """Get the newest UID of a content type.
+
+        Args:
+            content_type: Type of content ('image', 'video', ...)
+
+        Returns:
+            UID with the highest sequence number for that type, or None
+        """
+        self._ensure_loaded()
+        with self._lock.read_lock():
+            return self._latest_by_type.get(content_type)
+
+    def get_all_mappings(self) -> Mapping[str, Dict[str, Any]]:
+        """Get all UID mappings.
+
+        Returns:
+            Read-only live view of all UID mappings. Snapshot it (e.g.
+            ``list(view.items())``) before iterating if other threads may
+            add or delete mappings meanwhile. The mapping dicts are the
+            manager's own rows: read them, but never mutate them (copy a
+            row first if you need a modified version).
+        """
+        self._ensure_loaded()
+        # No lock: creating the view reads nothing, and it is used after
+        # any lock taken here would have been released
+        return MappingProxyType(self._uid_mappings)
     
     def _load_state(self) -> None:
-        """Load counter state and mappings from JSON file."""
+        """Load counter state and mappings from the snapshot, then replay the journal."""
         try:
-            if self._storage_file.exists():
-                with open(self._storage_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                    # Handle migration from old format
-                    if 'current_counter' in data:
-                        # Migrate from old single counter to img_counter
-                        self._img_counter = data.get('current_counter', 0)
-                        self._vid_counter = 0
-                        logger.info(f"Migrated old counter to img_counter: {self._img_counter}")
-                    else:
-                        # New format with separate counters
-                        self._img_counter = data.get('img_counter', 0)
-                        self._vid_counter = data.get('vid_counter', 0)
-                        self._obj_counter = data.get('obj_counter', 0)  # Load 3D object counter (OBJ)
-                        self._fbx_counter = data.get('fbx_counter', 0)  # Load FBX counter
-                        logger.info(f"Loaded counters - img: {self._img_counter}, vid: {self._vid_counter}, obj: {self._obj_counter}, fbx: {self._fbx_counter}")
-
-                    # Load mappings
-                    self._uid_mappings = data.get('uid_mappings', {})
-
-                    # Migrate existing mappings to include session_id field if missing
+            data = self._read_snapshot()
+            if data is not None:
+                # Handle migration from old format
+                if 'current_counter' in data:
+                    # Migrate from old single counter to img_counter
+                    self._img_counter = data.get('current_counter', 0)
+                    self._vid_counter = 0
+                    logger.info(f"Migrated old counter to img_counter: {self._img_counter}")
+                else:
+                    # New format with separate counters
+                    self._img_counter = data.get('img_counter', 0)
+                    self._vid_counter = data.get('vid_counter', 0)
+                    self._obj_counter = data.get('obj_counter', 0)  # Load 3D object counter (OBJ)
+                    self._fbx_counter = data.get('fbx_counter', 0)  # Load FBX counter
+                    logger.info(f"Loaded counters - img: {self._img_counter}, vid: {self._vid_counter}, obj: {self._obj_counter}, fbx: {self._fbx_counter}")
+
+                # Load mappings
+                self._uid_mappings = data.get('uid_mappings', {})
+
+                # Migrate existing mappings to include session_id field if missing
+                # (skipped for snapshots already written at the current schema)
+                if data.get('schema_version', 1) < _STATE_SCHEMA_VERSION:
                     migration_count = 0
                     for uid, mapping in self._uid_mappings.items():
                         if 'session_id' not in mapping:
@@ -297,10 +507,10 @@ class UIDManager:
 
                     if migration_count > 0:
                         logger.info(f"Migrated {migration_count} existing mappings to include session_id field")
-                        # Save the migrated data
-                        self._save_state()
+                    # Save the migrated data with the current schema_version
+                    self._save_state()
 
-                    logger.info(f"Loaded {len(self._uid_mappings)} UID mappings")
+                logger.info(f"Loaded {len(self._uid_mappings)} UID mappings")
 
             else:
                 self._img_counter = 0
@@ -310,40 +520,343 @@ class UIDManager:
                 # Create initial state file
                 self._save_state()
 
+            self._replay_journal()
+            self._read_counters()
+
         except Exception as e:
             logger.error(f"Failed to load UID state: {e}")
+            if self._storage_file.exists():
+                # Never continue (and later compact) an empty state over a
+                # snapshot that exists but could not be read
+                self._compact_pending = False
+                self._pending_records.clear()
+                raise RuntimeError(f"UID state at {self._storage_file.parent} could not be loaded: {e}") from e
             logger.info("Falling back to default state")
             self._img_counter = 0
             self._vid_counter = 0
             self._uid_mappings = {}
-    
+            # counters.bin still guards against re-issuing UIDs
+            self._read_counters()
+
+        self._rebuild_indices()
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Read the JSON snapshot, or None if there is none."""
+        try:
+            raw = self._storage_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        self._last_state_hash = self._state_digest(self._storage_file, raw)
+        return _json_loads(raw)
+
+    def _rebuild_indices(self) -> None:
+        """Rebuild the session/parent indices from _uid_mappings (caller holds _lock)."""
+        self._by_session = {}
+        self._by_parent = {}
+        self._latest_by_type = {}
+        for uid, mapping in self._uid_mappings.items():
+            self._index_mapping(uid, mapping)
+            self._track_latest(uid, mapping.get('type'))
+
+    def _track_latest(self, uid: str, content_type: Optional[str]) -> None:
+        """Record uid as the newest of its type if its sequence number is highest (caller holds _lock)."""
+        number = _uid_number(uid)
+        if number < 0:
+            return
+        current = self._latest_by_type.get(content_type)
+        if current is None or number > _uid_number(current):
+            self._latest_by_type[content_type] = uid
+
+    def _recompute_latest(self, content_type: Optional[str]) -> None:
+        """Rescan for the newest UID of a type after its latest was deleted (caller holds _lock)."""
+        self._latest_by_type.pop(content_type, None)
+        for uid, mapping in self._uid_mappings.items():
+            if mapping.get('type') == content_type:
+                self._track_latest(uid, content_type)
+
+    def _index_mapping(self, uid: str, mapping: Dict[str, Any]) -> None:
+        """Add uid to the session/parent indices (caller holds _lock)."""
+        self._by_session.setdefault(mapping.get('session_id'), {})[uid] = None
+        self._by_parent.setdefault(mapping.get('parent_uid'), {})[uid] = None
+
+    def _unindex_mapping(self, uid: str, mapping: Dict[str, Any]) -> None:
+        """Remove uid from the session/parent indices (caller holds _lock)."""
+        session_id = mapping.get('session_id')
+        members = self._by_session.get(session_id)
+        if members is not None:
+            members.pop(uid, None)
+            if not members:
+                del self._by_session[session_id]
+        self._unindex_parent(uid, mapping)
+
+    def _unindex_parent(self, uid: str, mapping: Dict[str, Any]) -> None:
+        """Remove uid from the parent index only (caller holds _lock)."""
+        parent_uid = mapping.get('parent_uid')
+        members = self._by_parent.get(parent_uid)
+        if members is not None:
+            members.pop(uid, None)
+            if not members:
+                del self._by_parent[parent_uid]
+
+    def _replay_journal(self) -> None:
+        """Apply journal records written since the last compaction."""
+        if not self._journal_file.exists():
+            return
+
+        replayed = 0
+        valid_bytes = 0
+        torn = False
+        with open(self._journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = _json_loads(line)
+                except ValueError:
+                    # Torn write from a crash mid-append; nothing valid follows
+                    logger.warning(f"Ignoring truncated UID journal record after {replayed} records")
+                    torn = True
+                    break
+                valid_bytes += len(line)
+
+                op = record.get('op')
+                if op == 'add':
+                    self._uid_mappings[record['uid']] = record['mapping']
+                elif op == 'delete':
+                    self._uid_mappings.pop(record['uid'], None)
+                elif op == 'counter' and record.get('name') in _COUNTER_ATTRS:
+                    # Written by versions before counters.bin
+                    setattr(self, _COUNTER_ATTRS[record['name']], record['value'])
+                replayed += 1
+
+        if torn:
+            # Drop the partial tail so new records start on a clean line
+            os.truncate(self._journal_file, valid_bytes)
+
+        self._journal_records = replayed
+        if replayed:
+            logger.info(f"Replayed {replayed} UID journal records")
+            if replayed >= self.COMPACT_THRESHOLD:
+                self._save_state()
+
+    def _read_counters(self) -> None:
+        """Apply counters.bin over the snapshot/journal values.
+
+        Counters only move forward, so the higher of the two wins; this also
+        tolerates a counters.bin older than the snapshot.
+        """
+        try:
+            raw = self._counters_file.read_bytes()
+        except FileNotFoundError:
+            return
+        if len(raw) < _COUNTERS_STRUCT.size:
+            logger.warning(f"Ignoring short UID counters file ({len(raw)} bytes)")
+            return
+
+        img, vid, obj, fbx = _COUNTERS_STRUCT.unpack_from(raw)
+        self._img_counter = max(self._img_counter, img)
+        self._vid_counter = max(self._vid_counter, vid)
+        self._obj_counter = max(self._obj_counter, obj)
+        self._fbx_counter = max(self._fbx_counter, fbx)
+
+    def _write_counters(self) -> None:
+        """Overwrite counters.bin with the current counters (caller holds _lock).
+
+        A 16-byte in-place write; fsync is left to the background flusher.
+        """
+        try:
+            if self._counters_fh is None:
+                mode = 'r+b' if self._counters_file.exists() else 'w+b'
+                self._counters_fh = open(self._counters_file, mode, buffering=0)
+            self._counters_fh.seek(0)
+            self._counters_fh.write(_COUNTERS_STRUCT.pack(
+                self._img_counter, self._vid_counter, self._obj_counter, self._fbx_counter
+            ))
+        except (OSError, struct.error) as e:
+            # Non-fatal: the snapshot carries the counters too
+            logger.error(f"Failed to write UID counters: {e}")
+            self._save_state()
+            return
+
+        self._counters_unsynced = True
+        self._mark_dirty()
+
+    def _sync_counters(self) -> None:
+        """fsync counters.bin if it changed since the last sync (caller holds _lock)."""
+        if not self._counters_unsynced:
+            return
+        try:
+            os.fsync(self._counters_fh.fileno())
+            self._counters_unsynced = False
+        except OSError as e:
+            logger.error(f"Failed to sync UID counters: {e}")
+
+    def _append_journal(self, record: Dict[str, Any]) -> None:
+        """Queue one mutation record for the journal (caller holds _lock).
+
+        Records are group-committed: the flusher writes everything queued
+        during a FLUSH_INTERVAL burst with a single write + fsync.
+        """
+        try:
+            self._pending_records.append(_json_dumps(record) + b'\n')
+        except Exception as e:
+            # Non-fatal: fall back to persisting the full snapshot
+            logger.error(f"Failed to encode UID journal record: {e}")
+            self._save_state()
+            return
+
+        self._journal_records += 1
+        if len(self._pending_records) >= self.JOURNAL_FSYNC_EVERY:
+            self._write_journal()
+        if self._journal_records >= self.COMPACT_THRESHOLD:
+            self._compact_pending = True
+        self._mark_dirty()
+
+    def _write_journal(self) -> None:
+        """Write and fsync all queued journal records in one batch (caller holds _lock)."""
+        if not self._pending_records:
+            return
+        try:
+            if self._journal is None:
+                self._journal = open(self._journal_file, 'ab', buffering=0)
+            self._journal.write(b''.join(self._pending_records))
+            os.fsync(self._journal.fileno())
+        except OSError as e:
+            # Non-fatal: the snapshot captures everything the batch held
+            logger.error(f"Failed to write UID journal: {e}")
+            self._save_state()
+        self._pending_records.clear()
+
     def _save_state(self) -> None:
-        """Save counter state and mappings to JSON file with atomic write."""
+        """Schedule a full snapshot rewrite (caller holds _lock).
+
+        Used for changes that are not expressed as journal records, such as
+        format migrations or direct edits to _uid_mappings.
+        """
+        self._compact_pending = True
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Wake the background flusher, starting it on first use (caller holds _lock)."""
+        self._dirty.set()
+        if self._flush_thread is None:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="UIDStateFlusher", daemon=True
+            )
+            self._flush_thread.start()
+            atexit.register(self.compact)
+
+    def _flush_loop(self) -> None:
+        """Background writer: wait for a mutation, let the burst settle, flush once."""
+        while True:
+            self._dirty.wait()
+            time.sleep(max(self.FLUSH_INTERVAL, self._compact_retry_delay))
+            self.flush()
+
+    def flush(self) -> None:
+        """Make pending mutations durable: write the journal batch, compacting if due."""
+        with self._io_lock:
+            if not self._dirty.is_set():
+                return
+            with self._lock:
+                self._dirty.clear()
+                if not self._initialized:
+                    # Loading failed; never persist the partial state
+                    return
+                self._sync_counters()
+                if self._compact_pending:
+                    self._compact_locked()
+                else:
+                    self._write_journal()
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with the current state and truncate the journal."""
+        with self._io_lock:
+            with self._lock:
+                if not self._initialized:
+                    return
+                self._sync_counters()
+                if not (self._journal_records or self._compact_pending):
+                    return
+                self._dirty.clear()
+                self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Snapshot + journal truncation; caller holds _io_lock and _lock so no
+        record can be appended between the two steps."""
+        state_data = {
+            'schema_version': _STATE_SCHEMA_VERSION,
+            'img_counter': self._img_counter,
+            'vid_counter': self._vid_counter,
+            'obj_counter': self._obj_counter,  # Save 3D object counter (OBJ)
+            'fbx_counter': self._fbx_counter,  # Save FBX counter
+            # No timestamp field (the file mtime records it) so identical
+            # states serialize to identical bytes for the _write_state hash check
+            'uid_mappings': self._uid_mappings
+        }
+        if not self._write_state(state_data):
+            # Keep the journal authoritative and re-arm the flusher so the
+            # snapshot is retried, backing off while the write keeps failing
+            self._write_journal()
+            self._compact_pending = True
+            self._compact_retry_delay = min(
+                max(self._compact_retry_delay * 2, 1.0), self.COMPACT_RETRY_MAX
+            )
+            self._mark_dirty()
+            return
+        self._compact_retry_delay = 0.0
+
         try:
-            # Prepare state data
-            state_data = {
-                'img_counter': self._img_counter,
-                'vid_counter': self._vid_counter,
-                'obj_counter': self._obj_counter,  # Save 3D object counter (OBJ)
-                'fbx_counter': self._fbx_counter,  # Save FBX counter
-                'uid_mappings': self._uid_mappings,
-                'last_updated': datetime.now().isoformat()
-            }
+            if self._journal is not None:
+                self._journal.truncate(0)
+            elif self._journal_file.exists():
+                self._journal_file.write_bytes(b'')
+        except OSError as e:
+            # Replaying records already in the snapshot is idempotent
+            logger.error(f"Failed to truncate UID journal: {e}")
+        self._journal_records = 0
+        self._pending_records.clear()
+        self._compact_pending = False
+
+    @staticmethod
+    def _state_digest(target: Path, payload: bytes) -> bytes:
+        """Short digest identifying a snapshot's file and contents."""
+        h = hashlib.blake2b(payload, digest_size=8)
+        h.update(target.suffix.encode())
+        return h.digest()
+
+    def _write_state(self, state_data: Dict[str, Any]) -> bool:
+        """Write a JSON state snapshot with atomic write."""
+        try:
+            target = self._storage_file
+            payload = _json_dumps(state_data, pretty=self.PRETTY_STATE)
+
+            # Skip the write when the bytes match the snapshot already on disk
+            digest = self._state_digest(target, payload)
+            if digest == self._last_state_hash and target.exists():
+                logger.debug("UID state unchanged; skipped snapshot write")
+                return True
 
             # Atomic write: write to temp file then rename
             temp_file = self._storage_file.with_suffix('.tmp')
 
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, indent=2, ensure_ascii=False)
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
 
             # Atomic rename
-            temp_file.replace(self._storage_file)
+            temp_file.replace(target)
+            self._last_state_hash = digest
 
-            logger.debug(f"Saved UID state: img={self._img_counter}, vid={self._vid_counter}, mappings={len(self._uid_mappings)}")
+            logger.debug(
+                f"Saved UID state: img={state_data['img_counter']}, vid={state_data['vid_counter']}, "
+                f"mappings={len(state_data['uid_mappings'])}"
+            )
+            return True
 
         except Exception as e:
             logger.error(f"Failed to save UID state: {e}")
             # Non-fatal: continue with in-memory state
+            return False
 
 
 # Global instance for shared UID generation
@@ -358,7 +871,12 @@ def get_uid_manager() -> UIDManager:
         Global UIDManager instance
     """
     global _global_uid_manager
-    
+
+    # Fast path: lock-free once initialized (double-checked locking)
+    manager = _global_uid_manager
+    if manager is not None:
+        return manager
+
     with _manager_lock:
         if _global_uid_manager is None:
             # Store UID state in data_storage directory for centralized management
@@ -392,6 +910,18 @@ def generate_image_uid() -> str:
     return get_uid_manager().get_next_image_uid()
 
 
+def generate_image_uids(count: int) -> List[str]:
+    """Convenience function to reserve several image UIDs at once.
+
+    Args:
+        count: Number of UIDs to generate
+
+    Returns:
+        List of sequential UID strings (e.g., [img_043, img_044])
+    """
+    return get_uid_manager().get_next_image_uids(count)
+
+
 def generate_video_uid() -> str:
     """Convenience function to generate next video UID.
 
@@ -426,6 +956,15 @@ def add_uid_mapping(uid: str, content_type: str, filename: str,
     get_uid_manager().add_mapping(uid, content_type, filename, parent_uid, session_id, metadata)
 
 
+def add_uid_mappings(entries: List[Dict[str, Any]]) -> None:
+    """Convenience function to add several UID mappings at once.
+
+    Args:
+        entries: Dicts with add_uid_mapping keyword arguments
+    """
+    get_uid_manager().add_mappings(entries)
+
+
 def get_uid_mapping(uid: str) -> Optional[Dict[str, Any]]:
     """Convenience function to get mapping for a UID.
 
@@ -480,25 +1019,10 @@ def get_latest_image_uid() -> Optional[str]:
     Returns:
         Latest image UID (img_XXX) or None if no images exist
     """
-    manager = get_uid_manager()
-    all_mappings = manager.get_all_mappings()
+    latest_uid = get_uid_manager().get_latest_uid('image')
 
-    # Filter for image UIDs only
-    image_mappings = {
-        uid: data for uid, data in all_mappings.items()
-        if uid.startswith('img_') and data.get('content_type') == 'image'
-    }
-
-    if not image_mappings:
+    if latest_uid is None:
         return None
 
-    # Sort by created_at timestamp (newest first)
-    sorted_images = sorted(
-        image_mappings.items(),
-        key=lambda x: x[1].get('created_at', ''),
-        reverse=True
-    )
-
-    latest_uid = sorted_images[0][0]
     logger.debug(f"Latest image UID from UID manager: {latest_uid}")
-    return latest_uid
\ No newline at end of file
+    return latest_uid
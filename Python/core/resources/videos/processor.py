@@ -11,11 +11,41 @@ Copyright Policy:
 import base64
 import logging
 import re
+from binascii import a2b_base64 as _b64decode
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+from core.resources.encoding import BASE64_WHITESPACE, estimate_base64_decoded_size
+
 logger = logging.getLogger("UnrealMCP.Resources.Videos")
 
+# Header only: the payload is decoded from match.end() rather than
+# captured, so no match group copies the whole base64 string
+_DATA_URI_RE = re.compile(r"^data:(video/[\w\-]+);base64,")
+
+# Base64 characters decoded per step; a multiple of 4 so every chunk
+# decodes independently
+_DECODE_CHUNK_CHARS = 4 * 64 * 1024
+
+
+def _decode_base64_from(data_str: str, start: int = 0) -> bytes:
+    """
+    Decode data_str[start:] in fixed-size chunks.
+
+    Avoids materializing a copy of the (possibly 100MB+) base64 payload just
+    to strip the data-URI header. Payloads containing whitespace cannot be
+    split on 4-character boundaries and are decoded in one step.
+    """
+    end = len(data_str)
+    if (end - start) % 4 or any(data_str.find(ws, start) != -1 for ws in BASE64_WHITESPACE):
+        return base64.b64decode(data_str[start:] if start else data_str)
+
+    parts = []
+    append = parts.append
+    for offset in range(start, end, _DECODE_CHUNK_CHARS):
+        append(_b64decode(data_str[offset:offset + _DECODE_CHUNK_CHARS]))
+    return b''.join(parts)
+
 
 class VideoProcessor:
     """
@@ -29,10 +59,11 @@ class VideoProcessor:
 
     # Video constraints
     MAX_VIDEO_SIZE_MB = 100  # Larger than images
-    ALLOWED_MIME_TYPES = {
+    _MAX_VIDEO_SIZE_BYTES = MAX_VIDEO_SIZE_MB * 1024 * 1024
+    ALLOWED_MIME_TYPES = frozenset({
         'video/mp4', 'video/mpeg', 'video/quicktime',
         'video/webm', 'video/x-msvideo'  # avi
-    }
+    })
 
     @classmethod
     def decode_base64_video(cls, data_str: str, mime_type: str = 'video/mp4') -> Dict[str, Any]:
@@ -53,26 +84,40 @@ class VideoProcessor:
         Raises:
             ValueError: Invalid format or unsupported type
         """
-        # Try Data URI format
-        match = re.match(r"^data:(video/[\w\-]+);base64,(.*)", data_str)
+        # Try Data URI format; fallback: raw base64 with the given mime_type
+        match = _DATA_URI_RE.match(data_str)
         if match:
-            mime_type, b64_data = match.groups()
+            mime_type = match.group(1)
+            start = match.end()
+        else:
+            start = 0
 
-            if mime_type not in cls.ALLOWED_MIME_TYPES:
+        if mime_type not in cls.ALLOWED_MIME_TYPES:
+            if match:
                 raise ValueError(
                     f"Unsupported video type: {mime_type}. "
-                    f"Allowed: {cls.ALLOWED_MIME_TYPES}"
+                    f"Allowed: {', '.join(sorted(cls.ALLOWED_MIME_TYPES))}"
                 )
+            mime_type = 'video/mp4'  # Raw base64: default to MP4
 
-            decoded_data = base64.b64decode(b64_data)
-            return {"mime_type": mime_type, "data": decoded_data}
+        cls._check_encoded_size(data_str, start)
+        decoded_data = _decode_base64_from(data_str, start)
+        return {"mime_type": mime_type, "data": decoded_data}
 
-        # Fallback: raw base64
-        if mime_type not in cls.ALLOWED_MIME_TYPES:
-            mime_type = 'video/mp4'  # Default to MP4
+    @classmethod
+    def _check_encoded_size(cls, b64_str: str, start: int = 0) -> None:
+        """
+        Reject oversized payloads before decoding.
 
-        decoded_data = base64.b64decode(data_str)
-        return {"mime_type": mime_type, "data": decoded_data}
+        Raises:
+            ValueError: If the estimated decoded size exceeds MAX_VIDEO_SIZE_MB
+        """
+        estimated = estimate_base64_decoded_size(b64_str, start)
+        if estimated > cls._MAX_VIDEO_SIZE_BYTES:
+            raise ValueError(
+                f"Video too large: ~{estimated / (1024 * 1024):.2f}MB "
+                f"(max: {cls.MAX_VIDEO_SIZE_MB}MB)"
+            )
 
     @classmethod
     def validate_video_size(cls, video_data: bytes, max_size_mb: int = None) -> None:
@@ -8,7 +8,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessResponse:
     """
     Standardized success response builder.
@@ -39,16 +39,14 @@ class SuccessResponse:
 
         Returns flat structure with success, status_code, message, and optional data/metadata.
         """
+        # Merge data into response (keeps existing patterns working)
         response = {
             "success": True,
             "status_code": self.status_code,
-            "message": self.message
+            "message": self.message,
+            **(self.data or {})
         }
 
-        # Merge data into response (keeps existing patterns working)
-        if self.data:
-            response.update(self.data)
-
         # Add metadata as separate field
         if self.metadata:
             response["metadata"] = self.metadata
@@ -229,12 +227,10 @@ def conversion_success(
     """
     data = {
         f"{source_type}_uid": source_uid,
-        f"{target_type}_uid": target_uid
+        f"{target_type}_uid": target_uid,
+        **(additional_data or {})
     }
 
-    if additional_data:
-        data.update(additional_data)
-
     return success_response(message=message, data=data)
 
 
@@ -15,21 +15,28 @@ Usage:
 from .base import (
     generate_request_id,
     get_current_timestamp,
-    calculate_file_size
+    calculate_file_size,
+    finalize_audit,
+    to_json,
+    SafeJSONEncoder,
+    FileSize
 )
 
 # Image schema builders
 from .image import (
     build_screenshot_response,
     build_transform_response,
-    extract_style_name
+    extract_style_name,
+    ScreenshotResponse,
+    TransformResponse
 )
 
 # Video schema builders
 from .video import (
     build_video_transform_response,
     extract_parent_filename,
-    generate_video_filename
+    generate_video_filename,
+    VideoTransformResponse
 )
 
 __all__ = [
@@ -37,14 +44,21 @@ __all__ = [
     'generate_request_id',
     'get_current_timestamp',
     'calculate_file_size',
+    'finalize_audit',
+    'to_json',
+    'SafeJSONEncoder',
+    'FileSize',
 
     # Image schemas
     'build_screenshot_response',
     'build_transform_response',
     'extract_style_name',
+    'ScreenshotResponse',
+    'TransformResponse',
 
     # Video schemas
     'build_video_transform_response',
     'extract_parent_filename',
-    'generate_video_filename'
+    'generate_video_filename',
+    'VideoTransformResponse'
 ]
@@ -5,23 +5,75 @@ Shared utilities for all schema builders across the application.
 Provides common functions for request tracking, timestamps, and file metadata.
 """
 
-import uuid
-from datetime import datetime, timezone
-from typing import Dict, Any
-from pathlib import Path
+import dataclasses
+import json
+import os
+import secrets
+import time
+from typing import Any, Dict, Tuple, TypedDict
+
+# orjson encodes response dicts several times faster; stdlib json is the fallback
+try:
+    import orjson
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+_gmtime = time.gmtime
+_strftime = time.strftime
+_time = time.time
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted; replaced
+# as a whole tuple so concurrent callers never see a mismatched pair
+_timestamp_prefix = (None, "")
+
+# path -> (expires_at, size in bytes); only successful stats are cached
+_FILE_SIZE_TTL = 2.0
+_FILE_SIZE_CACHE_MAX = 1024
+_file_size_cache: Dict[str, Tuple[float, int]] = {}
+
+
+# Response shapes shared by the image and video schema builders. They are
+# plain dicts at runtime; the declarations fix the key set for type checkers
+# and serializers.
+class FileSize(TypedDict):
+    bytes: int
+    display: str
+
+
+class ProcessingInfo(TypedDict):
+    model: str
+    origin: str
+    timestamp: str
+    version: str
+
+
+class AuditInfo(TypedDict):
+    request_id: str
+    duration_ms: int
+    server: str
 
 
 def generate_request_id() -> str:
     """Generate unique request ID for audit tracking."""
-    return f"req_{uuid.uuid4().hex[:12]}"
+    return "req_" + secrets.token_hex(6)
 
 
 def get_current_timestamp() -> str:
-    """Get current ISO timestamp in UTC."""
-    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+    """Get current ISO timestamp in UTC (e.g. 2025-01-31T12:00:00.123456Z)."""
+    # Built from time.time() with the date/time prefix cached per second,
+    # instead of a datetime object + isoformat() + replace() per call
+    global _timestamp_prefix
+    t = _time()
+    sec = int(t)
+    cached_sec, prefix = _timestamp_prefix
+    if sec != cached_sec:
+        prefix = _strftime("%Y-%m-%dT%H:%M:%S", _gmtime(sec))
+        _timestamp_prefix = (sec, prefix)
+    return "%s.%06dZ" % (prefix, int((t - sec) * 1_000_000))
 
 
-def calculate_file_size(file_path: str) -> Dict[str, Any]:
+def calculate_file_size(file_path: str) -> FileSize:
     """Calculate file size in bytes and display format.
 
     Args:
@@ -30,15 +82,80 @@ def calculate_file_size(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict with 'bytes' and 'display' keys
     """
-    try:
-        file_size_bytes = Path(file_path).stat().st_size
-        file_size_mb = file_size_bytes / (1024 * 1024)
-        return {
-            "bytes": file_size_bytes,
-            "display": f"{file_size_mb:.1f} MB"
-        }
-    except Exception:
-        return {
-            "bytes": 0,
-            "display": "0.0 MB"
-        }
+    # A response pipeline sizes the same file several times in quick
+    # succession; reuse the stat for a short TTL instead of re-issuing it
+    now = _time()
+    cached = _file_size_cache.get(file_path)
+    if cached is not None and cached[0] > now:
+        file_size_bytes = cached[1]
+    else:
+        try:
+            file_size_bytes = os.stat(file_path).st_size
+        except Exception:
+            return {
+                "bytes": 0,
+                "display": "0.0 MB"
+            }
+        if len(_file_size_cache) >= _FILE_SIZE_CACHE_MAX:
+            _file_size_cache.clear()
+        _file_size_cache[file_path] = (now + _FILE_SIZE_TTL, file_size_bytes)
+
+    file_size_mb = file_size_bytes / (1024 * 1024)
+    return {
+        "bytes": file_size_bytes,
+        "display": f"{file_size_mb:.1f} MB"
+    }
+
+
+def finalize_audit(start_time: float, file_path: str) -> Tuple[int, FileSize]:
+    """Measure a finished operation for its response.
+
+    Args:
+        start_time: Operation start timestamp (time.time())
+        file_path: Absolute path to the produced file
+
+    Returns:
+        Tuple of (duration_ms, file_size)
+    """
+    return int((_time() - start_time) * 1000), calculate_file_size(file_path)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert values JSON cannot encode natively (bytes, dataclasses, objects)."""
+    if isinstance(obj, bytes):
+        return f"<bytes:{len(obj)} bytes>"
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow field dict; slotted dataclasses have no __dict__
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    elif hasattr(obj, '__dict__'):
+        return obj.__dict__
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class SafeJSONEncoder(json.JSONEncoder):
+    """JSON encoder that safely handles bytes objects and other non-serializable types."""
+    def default(self, obj):
+        try:
+            return _json_default(obj)
+        except TypeError:
+            return super().default(obj)
+
+
+def to_json(obj: Any) -> bytes:
+    """Serialize a response to UTF-8 JSON bytes.
+
+    Uses orjson when installed, falling back to stdlib json with
+    SafeJSONEncoder (also for values orjson rejects, e.g. ints over 64 bits).
+
+    Args:
+        obj: Response object (usually a dict from a schema builder)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, cls=SafeJSONEncoder).encode('utf-8')
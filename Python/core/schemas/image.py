@@ -5,9 +5,106 @@ Standard schema builders for consistent image API responses.
 Handles screenshot captures and image transformations (AI styling, filters, etc.).
 """
 
-import time
-from typing import Dict, Any
-from .base import get_current_timestamp, calculate_file_size
+import re
+from types import MappingProxyType
+from typing import TypedDict
+from .base import (
+    get_current_timestamp, finalize_audit,
+    FileSize, ProcessingInfo, AuditInfo
+)
+
+# Constant response subtrees, copied and filled in per request. None marks a
+# per-request field; overriding it in the copy keeps the rendered key order.
+_SCREENSHOT_PROCESSING = MappingProxyType({
+    "model": "unreal",
+    "origin": "direct_capture",
+    "timestamp": None,
+    "version": "1.0.0"
+})
+_SCREENSHOT_AUDIT = MappingProxyType({
+    "request_id": None,
+    "duration_ms": None,
+    "server": "unreal-bridge"
+})
+_TRANSFORM_PROCESSING = MappingProxyType({
+    "model": "nanobanana",
+    "origin": None,
+    "timestamp": None,
+    "version": "1.0.0"
+})
+_TRANSFORM_COST = MappingProxyType({
+    "tokens": None,
+    "currency": "USD",
+    "value": None,
+    "pricing_model": "manual_config_v1"
+})
+_TRANSFORM_AUDIT = MappingProxyType({
+    "request_id": None,
+    "duration_ms": None,
+    "server": "render-node-05"
+})
+
+# Common style mappings, in match priority order
+_STYLE_MAPPINGS = {
+    "cyberpunk": "cyberpunk",
+    "anime": "anime",
+    "watercolor": "watercolor",
+    "oil painting": "oil_painting",
+    "sketch": "sketch",
+    "cartoon": "cartoon",
+    "photorealistic": "photorealistic",
+    "abstract": "abstract"
+}
+_STYLE_PRIORITY = {key: i for i, key in enumerate(_STYLE_MAPPINGS)}
+_STYLE_RE = re.compile("|".join(map(re.escape, _STYLE_MAPPINGS)))
+
+
+class ImageSize(TypedDict, total=False):
+    original: str
+    processed: str
+
+
+class StyleInfo(TypedDict):
+    name: str
+    intensity: float
+    prompt: str
+
+
+class ImageMetadata(TypedDict, total=False):
+    size: ImageSize
+    file_size: FileSize
+    style: StyleInfo
+
+
+class ImageInfo(TypedDict):
+    url: str
+    metadata: ImageMetadata
+
+
+class ImageUids(TypedDict, total=False):
+    image: str
+    parent: str
+
+
+class TransformCost(TypedDict):
+    tokens: int
+    currency: str
+    value: float
+    pricing_model: str
+
+
+class ScreenshotResponse(TypedDict):
+    success: bool
+    status_code: int
+    message: str
+    uids: ImageUids
+    processing: ProcessingInfo
+    image: ImageInfo
+    audit: AuditInfo
+
+
+class TransformResponse(ScreenshotResponse):
+    cost: TransformCost
 
 
 def build_screenshot_response(
@@ -18,7 +115,7 @@ def build_screenshot_response(
     height: int,
     request_id: str,
     start_time: float
-) -> Dict[str, Any]:
+) -> ScreenshotResponse:
     """Build standard schema response for screenshot operations.
 
     Args:
@@ -33,8 +130,7 @@ def build_screenshot_response(
     Returns:
         Standardized screenshot response with UIDs, metadata, and audit info
     """
-    duration_ms = int((time.time() - start_time) * 1000)
-    file_size = calculate_file_size(image_path)
+    duration_ms, file_size = finalize_audit(start_time, image_path)
 
     return {
         "success": True,
@@ -43,12 +139,7 @@ def build_screenshot_response(
         "uids": {
             "image": image_uid
         },
-        "processing": {
-            "model": "unreal",
-            "origin": "direct_capture",
-            "timestamp": get_current_timestamp(),
-            "version": "1.0.0"
-        },
+        "processing": {**_SCREENSHOT_PROCESSING, "timestamp": get_current_timestamp()},
         "image": {
             "url": f"/api/screenshot/{filename}",
             "metadata": {
@@ -58,11 +149,7 @@ def build_screenshot_response(
                 "file_size": file_size
             }
         },
-        "audit": {
-            "request_id": request_id,
-            "duration_ms": duration_ms,
-            "server": "unreal-bridge"
-        }
+        "audit": {**_SCREENSHOT_AUDIT, "request_id": request_id, "duration_ms": duration_ms}
     }
 
 
@@ -83,7 +170,7 @@ def build_transform_response(
     request_id: str,
     start_time: float,
     origin: str = "screenshot"
-) -> Dict[str, Any]:
+) -> TransformResponse:
     """Build standard schema response for image transformation operations.
 
     Args:
@@ -107,8 +194,7 @@ def build_transform_response(
     Returns:
         Standardized transformation response with parent tracking and cost info
     """
-    duration_ms = int((time.time() - start_time) * 1000)
-    file_size = calculate_file_size(image_path)
+    duration_ms, file_size = finalize_audit(start_time, image_path)
 
     return {
         "success": True,
@@ -118,12 +204,7 @@ def build_transform_response(
             "image": image_uid,
             "parent": parent_uid
         },
-        "processing": {
-            "model": "nanobanana",
-            "origin": origin,
-            "timestamp": get_current_timestamp(),
-            "version": "1.0.0"
-        },
+        "processing": {**_TRANSFORM_PROCESSING, "origin": origin, "timestamp": get_current_timestamp()},
         "image": {
             "url": f"/api/screenshot/{filename}",
             "metadata": {
@@ -139,17 +220,8 @@ def build_transform_response(
                 }
             }
         },
-        "cost": {
-            "tokens": tokens,
-            "currency": "USD",
-            "value": cost,
-            "pricing_model": "manual_config_v1"
-        },
-        "audit": {
-            "request_id": request_id,
-            "duration_ms": duration_ms,
-            "server": "render-node-05"
-        }
+        "cost": {**_TRANSFORM_COST, "tokens": tokens, "value": cost},
+        "audit": {**_TRANSFORM_AUDIT, "request_id": request_id, "duration_ms": duration_ms}
     }
 
 
@@ -165,22 +237,11 @@ def extract_style_name(style_prompt: str) -> str:
     # Simple extraction - take first word or phrase before comma
     style_name = style_prompt.split(',')[0].strip().lower()
 
-    # Common style mappings
-    style_mappings = {
-        "cyberpunk": "cyberpunk",
-        "anime": "anime",
-        "watercolor": "watercolor",
-        "oil painting": "oil_painting",
-        "sketch": "sketch",
-        "cartoon": "cartoon",
-        "photorealistic": "photorealistic",
-        "abstract": "abstract"
-    }
-
-    # Check for known styles
-    for key, value in style_mappings.items():
-        if key in style_name:
-            return value
+    # Check for known styles in one regex pass; if several appear, the one
+    # listed first in _STYLE_MAPPINGS wins
+    matches = _STYLE_RE.findall(style_name)
+    if matches:
+        return _STYLE_MAPPINGS[min(matches, key=_STYLE_PRIORITY.__getitem__)]
 
     # Default to cleaned first word
     return style_name.replace(' ', '_')[:20]
@@ -5,10 +5,96 @@ Standard schema builders for consistent video API responses.
 Handles video generation from images and video processing operations.
 """
 
-import time
-from typing import Dict, Any
-from pathlib import Path
-from .base import get_current_timestamp, calculate_file_size
+import os
+from types import MappingProxyType
+from typing import TypedDict
+from .base import (
+    get_current_timestamp, finalize_audit,
+    FileSize, ProcessingInfo, AuditInfo
+)
+
+_basename = os.path.basename
+_splitext = os.path.splitext
+
+# Constant response subtrees, copied and filled in per request. None marks a
+# per-request field; overriding it in the copy keeps the rendered key order.
+_VIDEO_PROCESSING = MappingProxyType({
+    "model": "veo-3.0-generate-001",
+    "origin": None,
+    "timestamp": None,
+    "version": "1.0.0"
+})
+_VIDEO_GENERATION = MappingProxyType({
+    "prompt": None,
+    "aspect_ratio": None,
+    "resolution": None,
+    "has_audio": True,
+    "watermarked": True
+})
+_VIDEO_COST = MappingProxyType({
+    "currency": "USD",
+    "value": None,
+    "display": None,
+    "pricing_model": "veo3_per_second_v1"
+})
+_VIDEO_AUDIT = MappingProxyType({
+    "request_id": None,
+    "duration_ms": None,
+    "server": "veo3-video-node"
+})
+
+
+class VideoUids(TypedDict):
+    video: str
+    parent: str
+
+
+class VideoSize(TypedDict):
+    original: str
+    processed: str
+
+
+class VideoDuration(TypedDict):
+    seconds: int
+    display: str
+
+
+class VideoGeneration(TypedDict):
+    prompt: str
+    aspect_ratio: str
+    resolution: str
+    has_audio: bool
+    watermarked: bool
+
+
+class VideoMetadata(TypedDict):
+    size: VideoSize
+    file_size: FileSize
+    duration: VideoDuration
+    generation: VideoGeneration
+
+
+class VideoInfo(TypedDict):
+    url: str
+    metadata: VideoMetadata
+
+
+class VideoCost(TypedDict):
+    currency: str
+    value: float
+    display: str
+    pricing_model: str
+
+
+class VideoTransformResponse(TypedDict):
+    success: bool
+    status_code: int
+    message: str
+    uids: VideoUids
+    processing: ProcessingInfo
+    video: VideoInfo
+    cost: VideoCost
+    audit: AuditInfo
 
 
 def build_video_transform_response(
@@ -28,7 +114,7 @@ def build_video_transform_response(
     request_id: str,
     start_time: float,
     origin: str = "latest_screenshot_to_video"
-) -> Dict[str, Any]:
+) -> VideoTransformResponse:
     """Build standard schema response for video generation operations.
 
     Args:
@@ -52,8 +138,7 @@ def build_video_transform_response(
     Returns:
         Standardized video generation response with metadata and cost tracking
     """
-    duration_ms = int((time.time() - start_time) * 1000)
-    file_size = calculate_file_size(video_path)
+    duration_ms, file_size = finalize_audit(start_time, video_path)
 
     return {
         "success": True,
@@ -63,12 +148,7 @@ def build_video_transform_response(
             "video": video_uid,
             "parent": parent_uid
         },
-        "processing": {
-            "model": "veo-3.0-generate-001",
-            "origin": origin,
-            "timestamp": get_current_timestamp(),
-            "version": "1.0.0"
-        },
+        "processing": {**_VIDEO_PROCESSING, "origin": origin, "timestamp": get_current_timestamp()},
         "video": {
             "url": f"/api/video/{filename}",
             "metadata": {
@@ -82,25 +162,15 @@ def build_video_transform_response(
                     "display": f"{duration_seconds}s"
                 },
                 "generation": {
+                    **_VIDEO_GENERATION,
                     "prompt": prompt,
                     "aspect_ratio": aspect_ratio,
-                    "resolution": resolution,
-                    "has_audio": True,
-                    "watermarked": True
+                    "resolution": resolution
                 }
             }
         },
-        "cost": {
-            "currency": "USD",
-            "value": cost,
-            "display": f"${cost:.3f}",
-            "pricing_model": "veo3_per_second_v1"
-        },
-        "audit": {
-            "request_id": request_id,
-            "duration_ms": duration_ms,
-            "server": "veo3-video-node"
-        }
+        "cost": {**_VIDEO_COST, "value": cost, "display": f"${cost:.3f}"},
+        "audit": {**_VIDEO_AUDIT, "request_id": request_id, "duration_ms": duration_ms}
     }
 
 
@@ -114,8 +184,9 @@ def extract_parent_filename(image_path: str) -> str:
         Filename stem (without extension)
     """
     try:
-        path = Path(image_path)
-        return path.stem  # Gets filename without extension
+        # String ops instead of building a Path; os.path uses the host
+        # platform's separators, as Path did
+        return _splitext(_basename(image_path))[0]
     except Exception:
         return "unknown_parent"
 
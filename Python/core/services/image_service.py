@@ -7,6 +7,8 @@ Handles image data extraction and processing from requests.
 from typing import Tuple, Optional, List, Dict, Any
 import logging
 
+from core.resources.images import process_main_image, process_reference_images
+
 logger = logging.getLogger("http_bridge.services.image")
 
 
@@ -31,8 +33,6 @@ def process_images_from_request(
     Note: No auto-fetching. If neither is provided, returns (None, None, reference_images)
     to enable true text-to-image generation mode.
     """
-    from core.resources.images import process_main_image, process_reference_images
-
     # Process main/target image (supports both UID and user upload)
     target_uid, main_image_data = process_main_image(
         main_image_request=request_data.get('mainImageData'),
@@ -41,7 +41,7 @@ def process_images_from_request(
 
     # Log selected image source
     if target_uid:
-        logger.debug(f"Using target image UID: {target_uid}")
+        logger.debug("Using target image UID: %s", target_uid)
     elif main_image_data:
         logger.debug("Using user-uploaded main image (in-memory, no UID)")
 
@@ -50,14 +50,14 @@ def process_images_from_request(
     reference_images = None
 
     if raw_reference_images:
-        logger.debug(f"Processing {len(raw_reference_images)} reference images")
+        logger.debug("Processing %d reference images", len(raw_reference_images))
         reference_images = process_reference_images(raw_reference_images)
-        logger.debug(f"Successfully processed {len(reference_images)} reference images")
+        logger.debug("Successfully processed %d reference images", len(reference_images))
 
         # Log reference image details
-        for i, ref in enumerate(reference_images):
-            size_kb = len(ref['data']) // 1024
-            logger.debug(f"Ref {i}: {ref['mime_type']}, {size_kb}KB")
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, ref in enumerate(reference_images):
+                logger.debug("Ref %d: %s, %dKB", i, ref['mime_type'], len(ref['data']) // 1024)
 
     return target_uid, main_image_data, reference_images
 
@@ -82,23 +82,26 @@ def prepare_reference_images_for_nlp(reference_images: Optional[List[Dict]]) ->
     if not reference_images:
         return None
 
+    # Per-image debug lines are only formatted when DEBUG is enabled
+    debug = logger.isEnabledFor(logging.DEBUG)
     nlp_reference_images = []
+    append = nlp_reference_images.append
 
     for i, ref in enumerate(reference_images):
+        data = ref.get('data')
+        mime_type = ref.get('mime_type')
+
         # Strict validation
-        if not ref.get('data'):
+        if not data:
             raise ValueError(f"Reference image {i}: Missing 'data' field")
-        if not ref.get('mime_type'):
+        if not mime_type:
             raise ValueError(f"Reference image {i}: Missing 'mime_type' field")
 
-        # Convert to NLP format (only data and mime_type)
-        nlp_ref = {
-            'data': ref['data'],
-            'mime_type': ref['mime_type']
-        }
-
-        nlp_reference_images.append(nlp_ref)
-        logger.debug(f"NLP ref {i}: mime_type={ref['mime_type']}, data_length={len(ref['data'])}")
+        # Convert to NLP format (only data and mime_type); refs from
+        # process_reference_images() already have exactly these keys
+        append(ref if len(ref) == 2 else {'data': data, 'mime_type': mime_type})
+        if debug:
+            logger.debug("NLP ref %d: mime_type=%s, data_length=%d", i, mime_type, len(data))
 
-    logger.debug(f"Successfully converted {len(nlp_reference_images)} reference images for NLP")
+    logger.debug("Successfully converted %d reference images for NLP", len(nlp_reference_images))
     return nlp_reference_images
@@ -27,7 +27,7 @@ def extract_prompts(request_data: dict) -> Tuple[Optional[str], List[str]]:
     main_prompt = request_data.get('main_prompt')
     reference_prompts = request_data.get('reference_prompts', [])
 
-    logger.debug(f"Extracted prompts - main: '{main_prompt}', references: {reference_prompts}")
+    logger.debug("Extracted prompts - main: '%s', references: %s", main_prompt, reference_prompts)
 
     # Auto-generate main_prompt if empty but references exist
     if _should_auto_generate_main_prompt(main_prompt, reference_prompts):
@@ -36,8 +36,8 @@ def extract_prompts(request_data: dict) -> Tuple[Optional[str], List[str]]:
         main_prompt = f"Apply style transformation: {combined}"
 
         logger.debug(
-            f"Auto-generated main_prompt (original was empty/None). "
-            f"Generated: '{main_prompt}'"
+            "Auto-generated main_prompt (original was empty/None). "
+            "Generated: '%s'", main_prompt
         )
 
     return main_prompt, reference_prompts
@@ -59,10 +59,10 @@ def _should_auto_generate_main_prompt(main_prompt: Optional[str], reference_prom
         2. reference_prompts is not empty
         3. At least one reference prompt has non-whitespace content
     """
-    # Check if main_prompt is empty/None
-    is_main_empty = not main_prompt or main_prompt.strip() == ''
+    # Check if main_prompt is empty/None (isspace() tests for whitespace-only
+    # without building a stripped copy)
+    if main_prompt and not main_prompt.isspace():
+        return False
 
     # Check if any reference prompt has content
-    has_reference_content = reference_prompts and any(p.strip() for p in reference_prompts)
-
-    return is_main_empty and has_reference_content
+    return bool(reference_prompts) and any(p and not p.isspace() for p in reference_prompts)
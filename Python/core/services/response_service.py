@@ -4,9 +4,17 @@ Response building service.
 Constructs standardized HTTP responses for different endpoints.
 """
 
-import datetime
 from typing import Dict, Any, Optional
 
+from core.schemas.base import get_current_timestamp
+
+_NO_SESSION = "No session"
+
+
+def _session_context(session_id: Optional[str]) -> str:
+    """Describe the session for debug_notes."""
+    return f"Session: {session_id}" if session_id else _NO_SESSION
+
 
 def build_nlp_response(
     result: Dict[str, Any],
@@ -47,23 +55,24 @@ def build_nlp_response(
             }
         }
     """
+    get = result.get
     return {
         "conversation_context": {
             "user_input": user_input,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": get_current_timestamp(),
             "trace_id": trace_id
         },
         "ai_processing": {
-            "explanation": result.get("explanation", ""),
-            "generated_commands": result.get("commands", []),
-            "expected_result": result.get("expectedResult", ""),
-            "processing_error": result.get("error"),
-            "fallback_used": result.get("fallback", False)
+            "explanation": get("explanation", ""),
+            "generated_commands": get("commands", []),
+            "expected_result": get("expectedResult", ""),
+            "processing_error": get("error"),
+            "fallback_used": get("fallback", False)
         },
-        "execution_results": result.get("executionResults", []),
+        "execution_results": get("executionResults", []),
         "debug_notes": {
             "message_role": "assistant",
-            "session_context": f"Session: {session_id}" if session_id else "No session"
+            "session_context": _session_context(session_id)
         }
     }
 
@@ -94,7 +103,7 @@ def build_error_response(
     return {
         "conversation_context": {
             "user_input": user_input or "",
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": get_current_timestamp(),
             "trace_id": trace_id
         },
         "ai_processing": {
@@ -107,6 +116,6 @@ def build_error_response(
         "execution_results": [],
         "debug_notes": {
             "message_role": "error",
-            "session_context": f"Session: {session_id}" if session_id else "No session"
+            "session_context": _session_context(session_id)
         }
     }
@@ -61,7 +61,7 @@ class SessionManager:
     
     def _get_storage(self) -> Optional[BaseStorage]:
         """Get the active storage backend."""
-        if self.storage and self.storage.health_check():
+        if self.storage and self.storage.cached_health_check():
             return self.storage
         else:
             logger.error("Storage backend not available or unhealthy")
@@ -399,7 +399,7 @@ class SessionManager:
         
         # Check storage
         if self.storage:
-            status['storage']['healthy'] = self.storage.health_check()
+            status['storage']['healthy'] = self.storage.cached_health_check()
             status['storage']['type'] = type(self.storage).__name__
             
             if status['storage']['healthy']:
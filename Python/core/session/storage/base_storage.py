@@ -2,16 +2,32 @@
 Abstract base class for session storage backends.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from bisect import bisect_left
+from typing import Optional, List, Iterable, Iterator, Tuple
 from datetime import datetime, timedelta
 
 from ..session_context import SessionContext
 
+# Usage report buckets: bisect_left(BOUNDS, value) indexes NAMES.
+# Age in days: 0 today, 1-7 this week, 8-30 this month, 31+ older
+# (a negative age from clock skew counts as this week).
+_AGE_BUCKET_BOUNDS = (-1, 0, 7, 30)
+_AGE_BUCKET_NAMES = ('this_week', 'today', 'this_week', 'this_month', 'older')
+# Messages: 0-5 light, 6-10 moderate, 11-20 active, 21+ very active
+_ACTIVITY_BUCKET_BOUNDS = (5, 10, 20)
+_ACTIVITY_BUCKET_NAMES = ('light', 'moderate', 'active', 'very_active')
+
 
 class BaseStorage(ABC):
     """Abstract base class for session storage implementations."""
     
+    # Seconds a health_check() result is reused by cached_health_check()
+    HEALTH_CHECK_TTL = 5.0
+    # (monotonic time of last check, result); replaced as a whole tuple
+    _health_cache: Tuple[float, bool] = (float('-inf'), False)
+    
     @abstractmethod
     def create_session(self, session_context: SessionContext) -> bool:
         """
@@ -51,6 +67,21 @@ class BaseStorage(ABC):
         """
         pass
     
+    def batch_update_sessions(self, session_contexts: List[SessionContext]) -> int:
+        """
+        Update several existing sessions in one call.
+        
+        The default implementation updates them one at a time; backends
+        should override it to share per-write overhead across the batch.
+        
+        Args:
+            session_contexts: The updated session contexts
+            
+        Returns:
+            Number of sessions updated successfully
+        """
+        return sum(1 for session_context in session_contexts if self.update_session(session_context))
+    
     @abstractmethod
     def delete_session(self, session_id: str) -> bool:
         """
@@ -78,6 +109,64 @@ class BaseStorage(ABC):
         """
         pass
     
+    def iter_sessions(self, chunk_size: int = 200) -> Iterator[SessionContext]:
+        """
+        Iterate all sessions, loading at most chunk_size at a time.
+        
+        The default implementation pages through list_sessions();
+        backends should override it when their ordering can shift
+        between pages.
+        
+        Args:
+            chunk_size: Number of sessions loaded per page
+            
+        Yields:
+            SessionContext objects
+        """
+        offset = 0
+        while True:
+            page = self.list_sessions(limit=chunk_size, offset=offset)
+            yield from page
+            if len(page) < chunk_size:
+                return
+            offset += chunk_size
+    
+    def iter_sessions_older_than(self, cutoff: datetime) -> Iterator[SessionContext]:
+        """
+        Iterate sessions created before cutoff.
+        
+        The default implementation filters iter_sessions(); backends that
+        keep creation dates in an index should override it so sessions
+        that do not match are never loaded.
+        
+        Args:
+            cutoff: Only sessions with created_at < cutoff are yielded
+            
+        Yields:
+            Matching SessionContext objects
+        """
+        for session in self.iter_sessions():
+            if session.created_at < cutoff:
+                yield session
+    
+    def list_sessions_older_than(self, cutoff: datetime, limit: int = 1000) -> List[SessionContext]:
+        """
+        List sessions created before cutoff.
+        
+        Args:
+            cutoff: Only sessions with created_at < cutoff are returned
+            limit: Maximum number of sessions to return
+            
+        Returns:
+            List of matching SessionContext objects
+        """
+        sessions = []
+        for session in self.iter_sessions_older_than(cutoff):
+            if len(sessions) >= limit:
+                break
+            sessions.append(session)
+        return sessions
+    
     @abstractmethod
     def cleanup_expired_sessions(self, max_age: timedelta = timedelta(days=30)) -> int:
         """
@@ -91,6 +180,23 @@ class BaseStorage(ABC):
         """
         pass
     
+    def cleanup_expired_sessions_batch(self, max_age: timedelta = timedelta(days=30),
+                                       batch_size: int = 500) -> Tuple[int, bool]:
+        """
+        Remove at most batch_size sessions older than max_age.
+        
+        The default implementation removes everything in one call;
+        backends should override it to bound the work done per call.
+        
+        Args:
+            max_age: Maximum age before deletion
+            batch_size: Maximum number of sessions to remove in this call
+            
+        Returns:
+            Tuple of (sessions deleted, whether more expired sessions remain)
+        """
+        return self.cleanup_expired_sessions(max_age), False
+    
     @abstractmethod
     def get_session_count(self) -> int:
         """
@@ -101,6 +207,63 @@ class BaseStorage(ABC):
         """
         pass
     
+    def get_usage_stats(self, now: Optional[datetime] = None) -> dict:
+        """
+        Aggregate session usage counters.
+        
+        The default implementation streams every session; backends that
+        can answer from an index should override it.
+        
+        Args:
+            now: Reference time for age buckets (default: current time)
+            
+        Returns:
+            Dictionary with total_sessions, total_messages,
+            average_messages_per_session, age_distribution and
+            activity_distribution
+        """
+        return self._summarize_usage(
+            ((s.created_at, len(s.conversation_history)) for s in self.iter_sessions()),
+            now or datetime.now()
+        )
+    
+    @staticmethod
+    def _summarize_usage(entries: Iterable[Tuple[datetime, int]], now: datetime) -> dict:
+        """Fold (created_at, message_count) pairs into usage counters."""
+        total_sessions = 0
+        total_messages = 0
+        
+        # Age distribution
+        age_buckets = {
+            'today': 0,
+            'this_week': 0,
+            'this_month': 0,
+            'older': 0
+        }
+        
+        # Activity distribution
+        activity_buckets = {
+            'very_active': 0,    # >20 messages
+            'active': 0,         # 10-20 messages
+            'moderate': 0,       # 5-10 messages
+            'light': 0           # <5 messages
+        }
+        
+        for created_at, msg_count in entries:
+            total_sessions += 1
+            total_messages += msg_count
+            age_days = (now - created_at).days
+            age_buckets[_AGE_BUCKET_NAMES[bisect_left(_AGE_BUCKET_BOUNDS, age_days)]] += 1
+            activity_buckets[_ACTIVITY_BUCKET_NAMES[bisect_left(_ACTIVITY_BUCKET_BOUNDS, msg_count)]] += 1
+        
+        return {
+            'total_sessions': total_sessions,
+            'total_messages': total_messages,
+            'average_messages_per_session': round(total_messages / total_sessions, 2) if total_sessions > 0 else 0,
+            'age_distribution': age_buckets,
+            'activity_distribution': activity_buckets
+        }
+    
     def health_check(self) -> bool:
         """
         Check if the storage backend is healthy and accessible.
@@ -113,4 +276,20 @@ class BaseStorage(ABC):
             self.get_session_count()
             return True
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    def cached_health_check(self) -> bool:
+        """
+        Return health_check(), re-running it at most once per HEALTH_CHECK_TTL.
+        
+        For status endpoints and per-operation guards that would otherwise
+        probe the backend on every call.
+        
+        Returns:
+            bool: Most recent health check result
+        """
+        checked_at, healthy = self._health_cache
+        if time.monotonic() - checked_at >= self.HEALTH_CHECK_TTL:
+            healthy = self.health_check()
+            self._health_cache = (time.monotonic(), healthy)
+        return healthy
@@ -7,7 +7,7 @@ import json
 import os
 import logging
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple
 from datetime import datetime, timedelta
 from threading import Lock
 
@@ -186,7 +186,8 @@ class FileStorage(BaseStorage):
                 self.session_index[session_context.session_id] = {
                     'file_path': str(relative_path),
                     'created_at': session_context.created_at.isoformat(),
-                    'last_accessed': datetime.now().isoformat()
+                    'last_accessed': datetime.now().isoformat(),
+                    'message_count': len(session_context.conversation_history)
                 }
                 self._save_index()
                 
@@ -237,8 +238,10 @@ class FileStorage(BaseStorage):
                     json.dump(session_data, f, indent=2, default=str)
                 
                 # Update index
-                if session_context.session_id in self.session_index:
-                    self.session_index[session_context.session_id]['last_accessed'] = datetime.now().isoformat()
+                index_entry = self.session_index.get(session_context.session_id)
+                if index_entry is not None:
+                    index_entry['last_accessed'] = datetime.now().isoformat()
+                    index_entry['message_count'] = len(session_context.conversation_history)
                     self._save_index()
                 
                 # Update statistics
@@ -251,6 +254,38 @@ class FileStorage(BaseStorage):
                 logger.error(f"Failed to update session {session_context.session_id}: {e}")
                 return False
     
+    def batch_update_sessions(self, session_contexts: List[SessionContext]) -> int:
+        """Update several session files, saving the index and stats once."""
+        updated_count = 0
+        with self._lock:
+            now_iso = datetime.now().isoformat()
+            for session_context in session_contexts:
+                try:
+                    session_path = self._find_session_path(session_context.session_id)
+                    if not session_path:
+                        logger.error(f"Session file not found for update: {session_context.session_id}")
+                        continue
+                    
+                    session_data = session_context.to_dict()
+                    with open(session_path, 'w', encoding='utf-8') as f:
+                        json.dump(session_data, f, indent=2, default=str)
+                    
+                    index_entry = self.session_index.get(session_context.session_id)
+                    if index_entry is not None:
+                        index_entry['last_accessed'] = now_iso
+                        index_entry['message_count'] = len(session_context.conversation_history)
+                    updated_count += 1
+                    
+                except Exception as e:
+                    logger.error(f"Failed to update session {session_context.session_id}: {e}")
+            
+            if updated_count > 0:
+                self._save_index()
+                self._update_stats('sessions_updated', updated_count)
+        
+        logger.debug(f"Batch updated {updated_count}/{len(session_contexts)} session files")
+        return updated_count
+    
     def delete_session(self, session_id: str) -> bool:
         """Delete a session file."""
         with self._lock:
@@ -304,42 +339,113 @@ class FileStorage(BaseStorage):
             logger.error(f"Failed to list sessions: {e}")
             return []
     
+    def _index_items_by_access(self) -> List[tuple]:
+        """Snapshot of index items, most recently accessed first (list_sessions order)."""
+        return sorted(
+            self.session_index.items(),
+            key=lambda x: x[1].get('last_accessed', ''),
+            reverse=True
+        )
+    
+    def iter_sessions(self, chunk_size: int = 200) -> Iterator[SessionContext]:
+        """Iterate all sessions one file at a time over an index snapshot."""
+        # The order is fixed up front: loading a session bumps its
+        # last_accessed, which would reshuffle offset-based pages
+        for session_id, _ in self._index_items_by_access():
+            session = self.get_session(session_id)
+            if session:
+                yield session
+    
+    def iter_sessions_older_than(self, cutoff: datetime) -> Iterator[SessionContext]:
+        """Iterate sessions created before cutoff, filtering on the index first."""
+        for session_id, index_data in self._index_items_by_access():
+            created_at = index_data.get('created_at')
+            if created_at:
+                try:
+                    if datetime.fromisoformat(created_at) >= cutoff:
+                        continue
+                except ValueError:
+                    pass  # Unparseable index date: decide from the session itself
+            
+            session = self.get_session(session_id)
+            if session and session.created_at < cutoff:
+                yield session
+    
     def cleanup_expired_sessions(self, max_age: timedelta = timedelta(days=30)) -> int:
         """Move expired sessions to archived folder."""
-        with self._lock:
-            try:
-                cutoff_date = datetime.now() - max_age
-                deleted_count = 0
-                sessions_to_remove = []
-                
-                # Check each session in the index
+        total_deleted = 0
+        while True:
+            deleted, more = self.cleanup_expired_sessions_batch(max_age)
+            total_deleted += deleted
+            if not more:
+                return total_deleted
+    
+    def cleanup_expired_sessions_batch(self, max_age: timedelta = timedelta(days=30),
+                                       batch_size: int = 500) -> Tuple[int, bool]:
+        """Move up to batch_size expired sessions to archived folder."""
+        try:
+            cutoff_date = datetime.now() - max_age
+            
+            # Snapshot expired IDs under the lock; delete_session takes the
+            # lock itself for each archive, so it is not held across the batch
+            with self._lock:
+                expired = []
                 for session_id, index_data in self.session_index.items():
                     try:
                         last_accessed = datetime.fromisoformat(index_data['last_accessed'])
                         if last_accessed < cutoff_date:
-                            # This session is expired, move to archived
-                            if self.delete_session(session_id):
-                                sessions_to_remove.append(session_id)
-                                deleted_count += 1
+                            expired.append(session_id)
+                            if len(expired) > batch_size:
+                                break
                     except Exception as e:
                         logger.warning(f"Error checking session {session_id} expiration: {e}")
-                
-                # Update statistics
-                if deleted_count > 0:
+            
+            deleted_count = 0
+            for session_id in expired[:batch_size]:
+                # This session is expired, move to archived
+                if self.delete_session(session_id):
+                    deleted_count += 1
+            
+            # Update statistics
+            if deleted_count > 0:
+                with self._lock:
                     self._update_stats('cleanup_operations')
-                    logger.info(f"Cleaned up {deleted_count} expired sessions")
-                
-                return deleted_count
-                
-            except Exception as e:
-                logger.error(f"Failed to cleanup expired sessions: {e}")
-                return 0
+                logger.info(f"Cleaned up {deleted_count} expired sessions")
+            
+            # Stop when a batch makes no progress so failing deletes cannot loop
+            more = len(expired) > batch_size and deleted_count > 0
+            return deleted_count, more
+            
+        except Exception as e:
+            logger.error(f"Failed to cleanup expired sessions: {e}")
+            return 0, False
     
     def get_session_count(self) -> int:
         """Get total number of active sessions."""
         return len(self.session_index)
     
-    def _update_stats(self, stat_name: str):
+    def get_usage_stats(self, now: Optional[datetime] = None) -> dict:
+        """Aggregate usage counters from the session index."""
+        def entries():
+            for session_id, index_data in self._index_items_by_access():
+                created_at = index_data.get('created_at')
+                msg_count = index_data.get('message_count')
+                if created_at and msg_count is not None:
+                    try:
+                        created = datetime.fromisoformat(created_at)
+                    except ValueError:
+                        created = None
+                    if created is not None:
+                        yield created, msg_count
+                        continue
+                # Entry predates message_count (or is incomplete): read the file
+                session = self.get_session(session_id)
+                if session:
+                    yield session.created_at, len(session.conversation_history)
+        
+        return self._summarize_usage(entries(), now or datetime.now())
+    
+    def _update_stats(self, stat_name: str, amount: int = 1):
         """Update usage statistics."""
         try:
             if self.stats_file.exists():
@@ -350,7 +456,7 @@ class FileStorage(BaseStorage):
             
             if stat_name not in stats:
                 stats[stat_name] = 0
-            stats[stat_name] += 1
+            stats[stat_name] += amount
             stats['last_updated'] = datetime.now().isoformat()
             
             with open(self.stats_file, 'w', encoding='utf-8') as f:
@@ -3,7 +3,7 @@ Utilities for session management.
 """
 
 from .session_helpers import generate_session_id, validate_session_id
-from .cleanup_tasks import SessionCleanupTasks
+from .cleanup_tasks import SessionCleanupTasks, PeriodicScheduler, get_periodic_scheduler
 # PathManager moved to core.utils.path_manager
 from core.utils.path_manager import PathManager, PathConfig, get_path_manager, reset_path_manager
 
@@ -11,6 +11,8 @@ __all__ = [
     'generate_session_id',
     'validate_session_id',
     'SessionCleanupTasks',
+    'PeriodicScheduler',
+    'get_periodic_scheduler',
     'PathManager',
     'PathConfig',
     'get_path_manager',
@@ -3,9 +3,11 @@ Background cleanup tasks for session management.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, List, Optional, Set, Tuple
 import threading
 import time
 
@@ -14,11 +16,139 @@ from ..storage.base_storage import BaseStorage
 logger = logging.getLogger("SessionManager.Cleanup")
 
 
+class PeriodicScheduler:
+    """
+    Runs periodic jobs on one shared background thread.
+
+    Jobs are kept in a heap ordered by their next monotonic deadline, so
+    any number of periodic tasks costs a single thread that only wakes
+    when the earliest job is due.
+    """
+    
+    # Delay before retrying a job whose callable raised
+    RETRY_DELAY = 60.0
+    
+    __slots__ = ('_heap', '_cond', '_thread', '_running', '_cancelled', '_ids')
+    
+    def __init__(self):
+        # Heap entries: (deadline_monotonic, job_id, interval_s, func)
+        self._heap: List[Tuple[float, int, float, Callable[[], object]]] = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._cancelled: Set[int] = set()
+        self._ids = itertools.count(1)
+    
+    def schedule(self, interval_s: float, func: Callable[[], object], delay_s: float = 0.0) -> int:
+        """
+        Run func every interval_s seconds, first after delay_s seconds.
+        
+        Returns:
+            Job ID that can be passed to cancel()
+        """
+        with self._cond:
+            job_id = next(self._ids)
+            heapq.heappush(self._heap, (time.monotonic() + delay_s, job_id, interval_s, func))
+            self._ensure_started()
+            self._cond.notify()
+        return job_id
+    
+    def cancel(self, job_id: int):
+        """Stop rescheduling a job; a run already in progress completes."""
+        with self._cond:
+            if any(entry[1] == job_id for entry in self._heap):
+                self._heap[:] = [entry for entry in self._heap if entry[1] != job_id]
+                heapq.heapify(self._heap)
+            else:
+                # Currently running; dropped when it would be rescheduled
+                self._cancelled.add(job_id)
+            self._cond.notify()
+    
+    def shutdown(self, timeout: Optional[float] = 10):
+        """Stop the scheduler thread and drop all jobs."""
+        with self._cond:
+            self._running = False
+            self._heap.clear()
+            self._cond.notify()
+            thread = self._thread
+            self._thread = None
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+    
+    def _ensure_started(self):
+        """Start the scheduler thread if needed (caller holds the lock)."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="PeriodicScheduler", daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        """Scheduler loop: sleep until the earliest deadline, run, reschedule."""
+        cond = self._cond
+        heap = self._heap
+        me = threading.current_thread()
+        while True:
+            with cond:
+                while True:
+                    # Exit on shutdown, or if a restart replaced this thread
+                    if self._thread is not me:
+                        return
+                    if not heap:
+                        cond.wait()
+                        continue
+                    remaining = heap[0][0] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                _, job_id, interval_s, func = heapq.heappop(heap)
+            
+            started = time.monotonic()
+            next_run = started + interval_s
+            try:
+                func()
+            except Exception as e:
+                logger.error("Error in scheduled job %s: %s", job_id, e)
+                next_run = time.monotonic() + min(interval_s, self.RETRY_DELAY)
+            
+            with cond:
+                if job_id in self._cancelled:
+                    self._cancelled.discard(job_id)
+                elif self._thread is me:
+                    heapq.heappush(heap, (next_run, job_id, interval_s, func))
+
+
+_global_scheduler: Optional[PeriodicScheduler] = None
+_global_scheduler_lock = threading.Lock()
+
+
+def get_periodic_scheduler() -> PeriodicScheduler:
+    """Get or create the shared PeriodicScheduler instance."""
+    global _global_scheduler
+    if _global_scheduler is None:
+        with _global_scheduler_lock:
+            if _global_scheduler is None:
+                _global_scheduler = PeriodicScheduler()
+    return _global_scheduler
+
+
 class SessionCleanupTasks:
     """Handles background cleanup tasks for session management."""
     
+    # Expired sessions are archived in batches to bound the time each
+    # batch holds storage, with a short pause between batches
+    CLEANUP_BATCH_SIZE = 500
+    CLEANUP_BATCH_PAUSE = 0.05
+    
+    __slots__ = (
+        'storage', 'cleanup_interval', 'session_max_age', 'running',
+        'scheduler', 'cleanup_job', 'cleanup_task', 'last_cleanup',
+        '_last_cleanup_mono'
+    )
+    
     def __init__(self, storage: BaseStorage, cleanup_interval_hours: int = 6, 
-                 session_max_age_days: int = 30):
+                 session_max_age_days: int = 30,
+                 scheduler: Optional[PeriodicScheduler] = None):
         """
         Initialize cleanup tasks.
         
@@ -26,58 +156,123 @@ class SessionCleanupTasks:
             storage: Storage backend to clean up
             cleanup_interval_hours: How often to run cleanup (in hours)
             session_max_age_days: Maximum age for sessions before deletion
+            scheduler: Scheduler for background runs (default: shared instance)
         """
         self.storage = storage
         self.cleanup_interval = timedelta(hours=cleanup_interval_hours)
         self.session_max_age = timedelta(days=session_max_age_days)
         self.running = False
-        self.cleanup_thread: Optional[threading.Thread] = None
+        self.scheduler = scheduler
+        self.cleanup_job: Optional[int] = None
+        self.cleanup_task: Optional[asyncio.Task] = None
+        # Scheduling runs on the monotonic clock; last_cleanup (wall clock)
+        # is kept for status display only
         self.last_cleanup: Optional[datetime] = None
+        self._last_cleanup_mono: Optional[float] = None
         
         logger.info(f"Cleanup tasks initialized - interval: {cleanup_interval_hours}h, max age: {session_max_age_days}d")
     
     def start_background_cleanup(self):
-        """Start background cleanup thread."""
+        """Start background cleanup on the shared scheduler thread."""
         if self.running:
             logger.warning("Cleanup tasks already running")
             return
         
         self.running = True
-        self.cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
-        self.cleanup_thread.start()
+        if self.scheduler is None:
+            self.scheduler = get_periodic_scheduler()
+        self.cleanup_job = self.scheduler.schedule(
+            self.cleanup_interval.total_seconds(), self._scheduled_cleanup,
+            delay_s=self._seconds_until_due()
+        )
         
         logger.info("Background cleanup tasks started")
     
+    async def start_background_cleanup_async(self):
+        """
+        Start background cleanup as a task on the running event loop.
+
+        For owners with a long-lived loop; no OS thread is held between runs.
+        Must be awaited from that loop.
+        """
+        if self.running:
+            logger.warning("Cleanup tasks already running")
+            return
+        
+        self.running = True
+        self.cleanup_task = asyncio.get_running_loop().create_task(self._cleanup_loop_async())
+        
+        logger.info("Background cleanup tasks started (event loop)")
+    
     def stop_background_cleanup(self):
-        """Stop background cleanup thread."""
+        """Stop background cleanup (thread or event-loop task)."""
         if not self.running:
             return
         
         self.running = False
-        if self.cleanup_thread:
-            self.cleanup_thread.join(timeout=10)
+        if self.cleanup_task:
+            # Task.cancel is not thread-safe; hand it to the task's own loop
+            self.cleanup_task.get_loop().call_soon_threadsafe(self.cleanup_task.cancel)
+        if self.cleanup_job is not None:
+            self.scheduler.cancel(self.cleanup_job)
+            self.cleanup_job = None
         
         logger.info("Background cleanup tasks stopped")
     
-    def _cleanup_loop(self):
-        """Main cleanup loop running in background thread."""
-        while self.running:
+    async def stop_background_cleanup_async(self):
+        """Stop background cleanup and wait for the event-loop task to finish."""
+        task = self.cleanup_task
+        self.stop_background_cleanup()
+        if task is not None:
             try:
-                # Check if it's time for cleanup
-                now = datetime.now()
-                if (self.last_cleanup is None or 
-                    now - self.last_cleanup >= self.cleanup_interval):
+                await task
+            except asyncio.CancelledError:
+                pass
+            self.cleanup_task = None
+    
+    def _scheduled_cleanup(self):
+        """Cleanup job run by the scheduler thread."""
+        logger.debug("Running scheduled cleanup")
+        started = time.monotonic()
+        now = datetime.now()
+        self.run_cleanup()
+        self._mark_cleaned(started, now)
+    
+    def _seconds_until_due(self, now_mono: Optional[float] = None) -> float:
+        """Seconds until the next scheduled cleanup (0 if one is due now)."""
+        if self._last_cleanup_mono is None:
+            return 0.0
+        if now_mono is None:
+            now_mono = time.monotonic()
+        remaining = self._last_cleanup_mono + self.cleanup_interval.total_seconds() - now_mono
+        return max(0.0, remaining)
+    
+    def _mark_cleaned(self, started_mono: float, started_at: datetime):
+        """Record a completed cleanup that started at the given times."""
+        self._last_cleanup_mono = started_mono
+        self.last_cleanup = started_at
+    
+    async def _cleanup_loop_async(self):
+        """Cleanup loop scheduled on the event loop; storage I/O runs in a worker thread."""
+        try:
+            while self.running:
+                try:
+                    started = time.monotonic()
+                    if self._seconds_until_due(started) == 0.0:
+                        logger.debug("Running scheduled cleanup")
+                        now = datetime.now()
+                        await asyncio.to_thread(self.run_cleanup)
+                        self._mark_cleaned(started, now)
                     
-                    logger.debug("Running scheduled cleanup")
-                    self.run_cleanup()
-                    self.last_cleanup = now
-                
-                # Sleep for a short interval before checking again
-                time.sleep(300)  # Check every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"Error in cleanup loop: {e}")
-                time.sleep(60)  # Wait a minute before retrying
+                    await asyncio.sleep(self._seconds_until_due())
+                    
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in cleanup loop: {e}")
+                    await asyncio.sleep(60)  # Wait a minute before retrying
+        except asyncio.CancelledError:
+            logger.debug("Cleanup task cancelled")
     
     def run_cleanup(self) -> dict:
         """
@@ -96,7 +291,15 @@ class SessionCleanupTasks:
             logger.info("Starting session cleanup")
             
             # Clean up expired sessions
-            deleted_count = self.storage.cleanup_expired_sessions(self.session_max_age)
+            deleted_count = 0
+            while True:
+                deleted, more = self.storage.cleanup_expired_sessions_batch(
+                    self.session_max_age, self.CLEANUP_BATCH_SIZE
+                )
+                deleted_count += deleted
+                if not more:
+                    break
+                time.sleep(self.CLEANUP_BATCH_PAUSE)
             stats['expired_sessions_deleted'] = deleted_count
             
             if deleted_count > 0:
@@ -112,7 +315,7 @@ class SessionCleanupTasks:
             logger.error(error_msg)
             stats['errors'].append(error_msg)
         
-        logger.debug(f"Cleanup completed: {stats}")
+        logger.debug("Cleanup completed: %s", stats)
         return stats
     
     def get_cleanup_status(self) -> dict:
@@ -128,7 +331,7 @@ class SessionCleanupTasks:
             'next_cleanup_due': (self.last_cleanup + self.cleanup_interval).isoformat() if self.last_cleanup else "Now",
             'cleanup_interval_hours': self.cleanup_interval.total_seconds() / 3600,
             'session_max_age_days': self.session_max_age.days,
-            'storage_healthy': self.storage.health_check()
+            'storage_healthy': self.storage.cached_health_check()
         }
     
     def force_cleanup_now(self) -> dict:
@@ -145,6 +348,11 @@ class SessionCleanupTasks:
 class SessionMaintenanceTasks:
     """Additional maintenance tasks for sessions."""
     
+    # Compressed sessions are written back in batches of this size
+    UPDATE_BATCH_SIZE = 200
+    
+    __slots__ = ('storage',)
+    
     def __init__(self, storage: BaseStorage):
         """
         Initialize maintenance tasks.
@@ -169,25 +377,40 @@ class SessionMaintenanceTasks:
         try:
             logger.info(f"Starting conversation compression for sessions older than {age_threshold_days} days")
             
-            sessions = self.storage.list_sessions(limit=1000)  # Process in batches
+            now = datetime.now()
+            now_iso = now.isoformat()
+            cutoff_date = now - timedelta(days=age_threshold_days)
+            # Age filter runs in storage so newer sessions are never loaded;
+            # sessions are streamed, so only the pending batch is held
             compressed_count = 0
-            cutoff_date = datetime.now() - timedelta(days=age_threshold_days)
+            pending = []
+            # Loop-invariant lookups bound once as locals
+            stage = pending.append
+            batch_update = self.storage.batch_update_sessions
+            batch_size = self.UPDATE_BATCH_SIZE
             
-            for session in sessions:
-                if session.created_at < cutoff_date and len(session.conversation_history) > max_messages_to_keep:
+            for session in self.storage.iter_sessions_older_than(cutoff_date):
+                history = session.conversation_history
+                original_count = len(history)
+                if original_count > max_messages_to_keep:
                     # Keep only the most recent messages
-                    original_count = len(session.conversation_history)
-                    session.conversation_history = session.conversation_history[-max_messages_to_keep:]
+                    session.conversation_history = history[-max_messages_to_keep:]
                     
                     # Add a note about compression
-                    session.metadata['compressed'] = True
-                    session.metadata['original_message_count'] = original_count
-                    session.metadata['compressed_at'] = datetime.now().isoformat()
+                    metadata = session.metadata
+                    metadata['compressed'] = True
+                    metadata['original_message_count'] = original_count
+                    metadata['compressed_at'] = now_iso
                     
-                    # Update the session
-                    if self.storage.update_session(session):
-                        compressed_count += 1
-                        logger.debug(f"Compressed session {session.session_id}: {original_count} -> {max_messages_to_keep} messages")
+                    # Stage the update; storage writes it with the rest of the batch
+                    stage(session)
+                    logger.debug("Compressed session %s: %d -> %d messages", session.session_id, original_count, max_messages_to_keep)
+                    if len(pending) >= batch_size:
+                        compressed_count += batch_update(pending)
+                        pending.clear()
+            
+            if pending:
+                compressed_count += batch_update(pending)
             
             if compressed_count > 0:
                 logger.info(f"Compressed {compressed_count} sessions")
@@ -208,58 +431,14 @@ class SessionMaintenanceTasks:
             Dictionary with usage statistics
         """
         try:
-            sessions = self.storage.list_sessions(limit=1000)
-            
-            total_sessions = len(sessions)
-            total_messages = sum(len(s.conversation_history) for s in sessions)
-            
-            # Age distribution
             now = datetime.now()
-            age_buckets = {
-                'today': 0,
-                'this_week': 0,
-                'this_month': 0,
-                'older': 0
-            }
-            
-            for session in sessions:
-                age_days = (now - session.created_at).days
-                if age_days == 0:
-                    age_buckets['today'] += 1
-                elif age_days <= 7:
-                    age_buckets['this_week'] += 1
-                elif age_days <= 30:
-                    age_buckets['this_month'] += 1
-                else:
-                    age_buckets['older'] += 1
-            
-            # Activity distribution
-            activity_buckets = {
-                'very_active': 0,    # >20 messages
-                'active': 0,         # 10-20 messages
-                'moderate': 0,       # 5-10 messages
-                'light': 0           # <5 messages
-            }
-            
-            for session in sessions:
-                msg_count = len(session.conversation_history)
-                if msg_count > 20:
-                    activity_buckets['very_active'] += 1
-                elif msg_count > 10:
-                    activity_buckets['active'] += 1
-                elif msg_count > 5:
-                    activity_buckets['moderate'] += 1
-                else:
-                    activity_buckets['light'] += 1
+            # Counting and bucketing happen in storage, next to the data
+            stats = self.storage.get_usage_stats(now)
             
             return {
                 'report_date': now.isoformat(),
-                'total_sessions': total_sessions,
-                'total_messages': total_messages,
-                'average_messages_per_session': round(total_messages / total_sessions, 2) if total_sessions > 0 else 0,
-                'age_distribution': age_buckets,
-                'activity_distribution': activity_buckets,
-                'storage_healthy': self.storage.health_check()
+                **stats,
+                'storage_healthy': self.storage.cached_health_check()
             }
             
         except Exception as e:
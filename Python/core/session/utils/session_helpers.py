@@ -2,37 +2,39 @@
 Utility functions for session management.
 """
 
-import uuid
+import os
 import re
 from datetime import datetime
 from typing import Optional
 
 
 def generate_session_id() -> str:
-    """Generate a new unique session ID."""
-    return str(uuid.uuid4())
+    """Generate a new unique session ID (random RFC 4122 version 4 UUID string)."""
+    # Same bits as str(uuid.uuid4()), without building a UUID object
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def validate_session_id(session_id: str) -> bool:
     """Validate that a session ID is properly formatted."""
-    if not session_id:
-        return False
-    
-    # Check if it's a valid UUID format
-    try:
-        uuid.UUID(session_id)
-        return True
-    except (ValueError, TypeError):
-        # Also accept session IDs that are at least 8 characters long
-        # to handle alternative or shortened session IDs
-        if isinstance(session_id, str) and len(session_id) >= 8:
-            return True
-        return False
-
-
-def format_session_age(created_at: datetime) -> str:
-    """Format session age in human-readable format."""
-    age = datetime.now() - created_at
+    # Canonical UUIDs are 36 characters, and alternative or shortened
+    # session IDs are accepted from 8 characters, so every string that
+    # uuid.UUID() would parse already passes the length check; no parse
+    # (or exception on the fallback path) is needed
+    return isinstance(session_id, str) and len(session_id) >= 8
+
+
+def format_session_age(created_at: datetime, now: Optional[datetime] = None) -> str:
+    """
+    Format session age in human-readable format.
+
+    Pass now when formatting a list of sessions so the clock is read once
+    for the whole batch.
+    """
+    age = (now or datetime.now()) - created_at
     
     if age.days > 0:
         return f"{age.days} day{'s' if age.days != 1 else ''} ago"
@@ -4,13 +4,41 @@ Handles all path-related operations, validation, and configuration.
 """
 
 import os
+import sys
+import shutil
 import logging
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from stat import S_ISDIR
+from typing import Optional, Dict, Any, Callable, Final, Iterable, Set, Tuple
 from dataclasses import dataclass
 
+from core.errors import AppError, ErrorCategory
+
 logger = logging.getLogger("PathManager")
 
+# Keys for PathManager._cached_paths
+_KEY_UNREAL_PROJECT: Final = "unreal_project"
+_KEY_MEGAMELANGE_BASE: Final = "megamelange_base"
+_KEY_ACTIVE_SESSIONS: Final = "active_sessions"
+_KEY_ARCHIVED_SESSIONS: Final = "archived_sessions"
+_KEY_METADATA: Final = "metadata"
+_KEY_LOGS: Final = "logs"
+_KEY_SESSION_INDEX: Final = "session_index"
+_KEY_STATS_FILE: Final = "stats_file"
+_KEY_DATA_STORAGE: Final = "data_storage"
+_KEY_UID: Final = "uid"
+_KEY_REFERENCE_IMAGES: Final = "reference_images"
+_KEY_GENERATED_IMAGES: Final = "generated_images"
+_KEY_VIDEOS: Final = "videos"
+_KEY_OBJECT_3D: Final = "object_3d"
+_KEY_OBJECTS3D_BASE: Final = "objects3d_base"
+_KEY_TEMP_PROCESSING: Final = "temp_processing"
+
+# 3D object UID prefix -> format directory under assets/objects3d
+_UID_FORMAT_DIRS = {'fbx_': 'fbx', 'obj_': 'obj'}
+
 
 @dataclass
 class PathConfig:
@@ -27,6 +55,105 @@ class PathConfig:
     copy_on_access: bool = True  # Copy strategy vs move strategy
     enable_centralized_paths: bool = True  # Feature flag for rollback support
 
+    # Filesystem checks (exists/is_dir/.uproject lookup) are reused for this long
+    stat_cache_ttl_seconds: float = 1.0
+    # get_path_info results are reused for this long
+    path_info_ttl_seconds: float = 5.0
+
+
+class _StatCache:
+    """
+    Short-lived cache of filesystem checks keyed by path string.
+
+    Repeated existence/type checks within a request cycle are answered from
+    memory; entries expire after the TTL and are dropped when PathManager
+    writes to the path.
+    """
+
+    __slots__ = ('ttl', '_entries')
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # (kind, path) -> (value, monotonic_deadline)
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+
+    def _lookup(self, kind: str, path: str, compute: Callable[[str], Any]) -> Any:
+        key = (kind, path)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        value = compute(path)
+        if self.ttl > 0:
+            self._entries[key] = (value, now + self.ttl)
+        return value
+
+    def get_stat(self, path: str) -> Optional[os.stat_result]:
+        """os.stat result for the path, or None if it cannot be stat'ed."""
+        return self._lookup('stat', path, self._safe_stat)
+
+    def get_exists(self, path: str) -> bool:
+        return self.get_stat(path) is not None
+
+    def get_is_dir(self, path: str) -> bool:
+        # Shares the cached stat with get_exists: one syscall per path
+        st = self.get_stat(path)
+        return st is not None and S_ISDIR(st.st_mode)
+
+    @staticmethod
+    def _safe_stat(path: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+    def get_uproject_glob(self, path: str) -> Optional[str]:
+        """
+        Name of the first .uproject file in the directory, or None.
+
+        The result is stored with the directory's mtime; after the TTL it is
+        reused without rescanning as long as the mtime is unchanged.
+        """
+        key = ('uproject', path)
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0][1]
+        st = self.get_stat(path)
+        if st is None:
+            return None
+        mtime = st.st_mtime_ns
+        if entry is not None and entry[0][0] == mtime:
+            value = entry[0][1]
+        else:
+            value = self._first_uproject(path)
+        self._entries[key] = ((mtime, value), now + self.ttl)
+        return value
+
+    @staticmethod
+    def _first_uproject(path: str) -> Optional[str]:
+        # Stops at the first match instead of listing the whole directory
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.endswith(".uproject") and entry.is_file(follow_symlinks=False):
+                        return entry.name
+        except OSError:
+            pass
+        return None
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop cached checks for a path and its ancestors, or everything."""
+        if path is None:
+            self._entries.clear()
+            return
+        paths = set()
+        while path not in paths:
+            paths.add(path)
+            path = os.path.dirname(path)
+        for key in [key for key in self._entries if key[1] in paths]:
+            self._entries.pop(key, None)
+
 
 class PathManager:
     """
@@ -51,6 +178,15 @@ class PathManager:
         """
         self.config = config or PathConfig()
         self._cached_paths: Dict[str, str] = {}
+        # Directories already created by this instance; mkdir is skipped for them
+        self._dirs_ensured: Set[str] = set()
+        # (year, month, day) -> active session directory for that day
+        self._session_dirs: Dict[Tuple[int, int, int], str] = {}
+        self._stat_cache = _StatCache(self.config.stat_cache_ttl_seconds)
+        # Warn about a missing Unreal project only once per instance
+        self._unreal_missing_logged = False
+        # get_path_info result and its monotonic expiry
+        self._path_info_cache: Optional[Tuple[Dict[str, Any], float]] = None
 
         logger.debug("PathManager initialized")
 
@@ -61,8 +197,9 @@ class PathManager:
         Returns:
             str: Unreal project path if found, None otherwise
         """
-        if 'unreal_project' in self._cached_paths:
-            return self._cached_paths['unreal_project']
+        if _KEY_UNREAL_PROJECT in self._cached_paths:
+            # "" records that no valid project path was found
+            return self._cached_paths[_KEY_UNREAL_PROJECT] or None
 
         # Priority order for path resolution
         sources = [
@@ -75,13 +212,18 @@ class PathManager:
             if path and path.strip():
                 path = path.strip()
                 if self.validate_unreal_project_path(path):
-                    self._cached_paths['unreal_project'] = path
+                    self._cached_paths[_KEY_UNREAL_PROJECT] = path
                     logger.info(f"Unreal project path resolved from {source_name}: {path}")
                     return path
                 else:
                     logger.warning(f"Invalid Unreal project path from {source_name}: {path}")
 
-        logger.warning("No valid Unreal project path found")
+        if self._unreal_missing_logged:
+            logger.debug("No valid Unreal project path found")
+        else:
+            logger.warning("No valid Unreal project path found")
+            self._unreal_missing_logged = True
+        self._cached_paths[_KEY_UNREAL_PROJECT] = ""
         return None
 
     def validate_unreal_project_path(self, path: str) -> bool:
@@ -98,21 +240,21 @@ class PathManager:
             return False
 
         try:
-            project_path = Path(path)
+            stat_cache = self._stat_cache
 
-            # Check if directory exists
-            if not project_path.exists() or not project_path.is_dir():
+            # Check that the path is an existing directory (one stat call)
+            if not stat_cache.get_is_dir(path):
                 return False
 
             # Look for .uproject files (indicates Unreal project)
-            uproject_files = list(project_path.glob("*.uproject"))
-            if uproject_files:
-                logger.debug(f"Found .uproject file: {uproject_files[0].name}")
+            uproject_file = stat_cache.get_uproject_glob(path)
+            if uproject_file:
+                logger.debug(f"Found .uproject file: {uproject_file}")
                 return True
 
             # If no .uproject, check if it's a valid directory that could contain one
             # (for cases where we're setting up the project structure)
-            if project_path.exists():
+            if stat_cache.get_is_dir(path):
                 logger.debug(f"Directory exists but no .uproject found: {path}")
                 return True
 
@@ -132,8 +274,8 @@ class PathManager:
         Raises:
             RuntimeError: If unable to determine a valid path
         """
-        if 'megamelange_base' in self._cached_paths:
-            return self._cached_paths['megamelange_base']
+        if _KEY_MEGAMELANGE_BASE in self._cached_paths:
+            return self._cached_paths[_KEY_MEGAMELANGE_BASE]
 
         # Method 1: Explicit configuration
         if self.config.megamelange_base_path:
@@ -141,7 +283,6 @@ class PathManager:
             logger.info(f"Using configured MegaMelange path: {base_path}")
         else:
             # Method 2: Use centralized data_storage path with PyInstaller compatibility
-            import sys
             if getattr(sys, 'frozen', False):
                 # Running as compiled executable (PyInstaller)
                 executable_dir = Path(sys.executable).parent
@@ -156,13 +297,13 @@ class PathManager:
         # Validate and optionally create the path
         if self.config.create_directories:
             try:
-                Path(base_path).mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(base_path)
                 logger.debug(f"Ensured MegaMelange base directory exists: {base_path}")
             except Exception as e:
                 logger.error(f"Failed to create MegaMelange directory {base_path}: {e}")
                 raise RuntimeError(f"Failed to create MegaMelange directory: {e}")
 
-        self._cached_paths['megamelange_base'] = base_path
+        self._cached_paths[_KEY_MEGAMELANGE_BASE] = base_path
         return base_path
 
     def get_sessions_directory(self) -> str:
@@ -171,27 +312,57 @@ class PathManager:
 
     def get_active_sessions_directory(self) -> str:
         """Get the active sessions directory path."""
-        return os.path.join(self.get_sessions_directory(), 'active')
+        if _KEY_ACTIVE_SESSIONS in self._cached_paths:
+            return self._cached_paths[_KEY_ACTIVE_SESSIONS]
+
+        path = os.path.join(self.get_sessions_directory(), 'active')
+        self._cached_paths[_KEY_ACTIVE_SESSIONS] = path
+        return path
 
     def get_archived_sessions_directory(self) -> str:
         """Get the archived sessions directory path."""
-        return os.path.join(self.get_sessions_directory(), 'archived')
+        if _KEY_ARCHIVED_SESSIONS in self._cached_paths:
+            return self._cached_paths[_KEY_ARCHIVED_SESSIONS]
+
+        path = os.path.join(self.get_sessions_directory(), 'archived')
+        self._cached_paths[_KEY_ARCHIVED_SESSIONS] = path
+        return path
 
     def get_metadata_directory(self) -> str:
         """Get the metadata directory path."""
-        return os.path.join(self.get_sessions_directory(), 'metadata')
+        if _KEY_METADATA in self._cached_paths:
+            return self._cached_paths[_KEY_METADATA]
+
+        path = os.path.join(self.get_sessions_directory(), 'metadata')
+        self._cached_paths[_KEY_METADATA] = path
+        return path
 
     def get_logs_directory(self) -> str:
         """Get the logs directory path."""
-        return os.path.join(self.get_megamelange_base_path(), 'logs')
+        if _KEY_LOGS in self._cached_paths:
+            return self._cached_paths[_KEY_LOGS]
+
+        path = os.path.join(self.get_megamelange_base_path(), 'logs')
+        self._cached_paths[_KEY_LOGS] = path
+        return path
 
     def get_session_index_file(self) -> str:
         """Get the session index file path."""
-        return os.path.join(self.get_metadata_directory(), 'session_index.json')
+        if _KEY_SESSION_INDEX in self._cached_paths:
+            return self._cached_paths[_KEY_SESSION_INDEX]
+
+        path = os.path.join(self.get_metadata_directory(), 'session_index.json')
+        self._cached_paths[_KEY_SESSION_INDEX] = path
+        return path
 
     def get_stats_file(self) -> str:
         """Get the statistics file path."""
-        return os.path.join(self.get_metadata_directory(), 'stats.json')
+        if _KEY_STATS_FILE in self._cached_paths:
+            return self._cached_paths[_KEY_STATS_FILE]
+
+        path = os.path.join(self.get_metadata_directory(), 'stats.json')
+        self._cached_paths[_KEY_STATS_FILE] = path
+        return path
 
     def get_session_file_path(self, session_id: str, created_at = None) -> str:
         """
@@ -204,20 +375,22 @@ class PathManager:
         Returns:
             str: Full path to session file
         """
-        from datetime import datetime
-
         if created_at is None:
             created_at = datetime.now()
 
-        # Organize by year-month and day
-        year_month = created_at.strftime("%Y-%m")
-        day = created_at.strftime("day-%d")
+        # Organize by year-month and day; each day's directory is built and
+        # created once, then looked up by date
+        day_key = (created_at.year, created_at.month, created_at.day)
+        session_dir = self._session_dirs.get(day_key)
+        if session_dir is None:
+            year_month = created_at.strftime("%Y-%m")
+            day = created_at.strftime("day-%d")
+            session_dir = os.path.join(self.get_active_sessions_directory(), year_month, day)
 
-        session_dir = os.path.join(self.get_active_sessions_directory(), year_month, day)
-
-        # Create directory if needed
-        if self.config.create_directories:
-            Path(session_dir).mkdir(parents=True, exist_ok=True)
+            # Create directory if needed
+            if self.config.create_directories:
+                self._ensure_dir(session_dir)
+            self._session_dirs[day_key] = session_dir
 
         return os.path.join(session_dir, f"session_{session_id}.json")
 
@@ -231,15 +404,14 @@ class PathManager:
         Returns:
             str: Data storage base path
         """
-        if 'data_storage' in self._cached_paths:
-            return self._cached_paths['data_storage']
+        if _KEY_DATA_STORAGE in self._cached_paths:
+            return self._cached_paths[_KEY_DATA_STORAGE]
 
         if self.config.resource_base_path:
             base_path = self.config.resource_base_path
             logger.info(f"Using configured resource base path: {base_path}")
         else:
             # For PyInstaller compatibility: use executable directory
-            import sys
             if getattr(sys, 'frozen', False):
                 # Running as compiled executable (PyInstaller)
                 executable_dir = Path(sys.executable).parent
@@ -252,18 +424,22 @@ class PathManager:
                 logger.info(f"Using script-based data storage path (dev): {base_path}")
 
         if self.config.create_directories:
-            Path(base_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(base_path)
 
-        self._cached_paths['data_storage'] = base_path
+        self._cached_paths[_KEY_DATA_STORAGE] = base_path
         return base_path
 
     def get_uid_storage_path(self) -> str:
         """Get the UID storage directory path."""
+        if _KEY_UID in self._cached_paths:
+            return self._cached_paths[_KEY_UID]
+
         uid_path = os.path.join(self.get_data_storage_path(), 'uid')
 
         if self.config.create_directories:
-            Path(uid_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(uid_path)
 
+        self._cached_paths[_KEY_UID] = uid_path
         return uid_path
 
     def get_reference_images_path(self) -> str:
@@ -273,8 +449,8 @@ class PathManager:
         Returns:
             str: Reference images base path (assets/images/references)
         """
-        if 'reference_images' in self._cached_paths:
-            return self._cached_paths['reference_images']
+        if _KEY_REFERENCE_IMAGES in self._cached_paths:
+            return self._cached_paths[_KEY_REFERENCE_IMAGES]
 
         if self.config.reference_images_path:
             ref_path = self.config.reference_images_path
@@ -285,9 +461,9 @@ class PathManager:
             logger.debug(f"Using default reference images path: {ref_path}")
 
         if self.config.create_directories:
-            Path(ref_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(ref_path)
 
-        self._cached_paths['reference_images'] = ref_path
+        self._cached_paths[_KEY_REFERENCE_IMAGES] = ref_path
         return ref_path
 
     def get_generated_images_path(self) -> str:
@@ -297,17 +473,17 @@ class PathManager:
         Returns:
             str: Generated images path (assets/images/generated)
         """
-        if 'generated_images' in self._cached_paths:
-            return self._cached_paths['generated_images']
+        if _KEY_GENERATED_IMAGES in self._cached_paths:
+            return self._cached_paths[_KEY_GENERATED_IMAGES]
 
         # Default to assets/images/generated for AI-generated images
         gen_path = os.path.join(self.get_data_storage_path(), 'assets', 'images', 'generated')
         logger.debug(f"Using generated images path: {gen_path}")
 
         if self.config.create_directories:
-            Path(gen_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(gen_path)
 
-        self._cached_paths['generated_images'] = gen_path
+        self._cached_paths[_KEY_GENERATED_IMAGES] = gen_path
         return gen_path
 
     def get_videos_path(self) -> str:
@@ -317,17 +493,17 @@ class PathManager:
         Returns:
             str: Videos path (assets/videos)
         """
-        if 'videos' in self._cached_paths:
-            return self._cached_paths['videos']
+        if _KEY_VIDEOS in self._cached_paths:
+            return self._cached_paths[_KEY_VIDEOS]
 
         # Default to assets/videos
         videos_path = os.path.join(self.get_data_storage_path(), 'assets', 'videos')
         logger.debug(f"Using videos path: {videos_path}")
 
         if self.config.create_directories:
-            Path(videos_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(videos_path)
 
-        self._cached_paths['videos'] = videos_path
+        self._cached_paths[_KEY_VIDEOS] = videos_path
         return videos_path
 
     def get_3d_objects_path(self) -> str:
@@ -337,16 +513,16 @@ class PathManager:
         Returns:
             str: 3D objects base storage path (assets/objects3d/obj)
         """
-        if 'object_3d' in self._cached_paths:
-            return self._cached_paths['object_3d']
+        if _KEY_OBJECT_3D in self._cached_paths:
+            return self._cached_paths[_KEY_OBJECT_3D]
 
         # Use assets/objects3d/obj path for better asset organization
         objects_path = os.path.join(self.get_data_storage_path(), 'assets', 'objects3d', 'obj')
 
         if self.config.create_directories:
-            Path(objects_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(objects_path)
 
-        self._cached_paths['object_3d'] = objects_path
+        self._cached_paths[_KEY_OBJECT_3D] = objects_path
         return objects_path
 
     def get_3d_object_uid_path(self, uid: str, session_id: Optional[str] = None) -> str:
@@ -367,21 +543,18 @@ class PathManager:
         Returns:
             str: Path to the specific object directory
         """
-        # Detect format from UID prefix
-        if uid.startswith('fbx_'):
-            format_dir = 'fbx'
-        elif uid.startswith('obj_'):
-            format_dir = 'obj'
-        else:
-            # Default to obj for backwards compatibility
-            format_dir = 'obj'
+        # Detect format from UID prefix (default to obj for backwards compatibility)
+        format_dir = _UID_FORMAT_DIRS.get(uid[:4], 'obj')
 
         # Build path: assets/objects3d/{format}/uid/
-        base_storage = self.get_data_storage_path()
-        object_path = os.path.join(base_storage, 'assets', 'objects3d', format_dir, uid)
+        objects_base = self._cached_paths.get(_KEY_OBJECTS3D_BASE)
+        if objects_base is None:
+            objects_base = os.path.join(self.get_data_storage_path(), 'assets', 'objects3d')
+            self._cached_paths[_KEY_OBJECTS3D_BASE] = objects_base
+        object_path = os.path.join(objects_base, format_dir, uid)
 
         if self.config.create_directories:
-            Path(object_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(object_path)
 
         return object_path
 
@@ -398,7 +571,7 @@ class PathManager:
             return None
 
         saved_path = os.path.join(unreal_path, 'Saved')
-        return saved_path if Path(saved_path).exists() else None
+        return saved_path if self._stat_cache.get_exists(saved_path) else None
 
     def get_unreal_screenshots_path(self) -> Optional[str]:
         """
@@ -429,7 +602,7 @@ class PathManager:
 
         # Create styled directory if it doesn't exist
         if self.config.create_directories:
-            Path(styled_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(styled_path)
 
         return styled_path
 
@@ -440,18 +613,19 @@ class PathManager:
         Returns:
             str: Temporary processing path
         """
-        if 'temp_processing' in self._cached_paths:
-            return self._cached_paths['temp_processing']
+        if _KEY_TEMP_PROCESSING in self._cached_paths:
+            return self._cached_paths[_KEY_TEMP_PROCESSING]
 
         temp_path = os.path.join(self.get_data_storage_path(), 'temp', 'processing')
 
         if self.config.create_directories:
-            Path(temp_path).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(temp_path)
 
-        self._cached_paths['temp_processing'] = temp_path
+        self._cached_paths[_KEY_TEMP_PROCESSING] = temp_path
         return temp_path
 
-    def copy_resource_to_centralized(self, source_path: str, resource_type: str, target_name: str = None) -> Optional[str]:
+    def copy_resource_to_centralized(self, source_path: str, resource_type: str, target_name: str = None,
+                                     preserve_metadata: bool = False) -> Optional[str]:
         """
         Copy a resource to centralized storage using copy strategy.
 
@@ -459,6 +633,7 @@ class PathManager:
             source_path: Original resource path
             resource_type: Type of resource ('uid', 'reference', 'screenshot', 'temp')
             target_name: Optional target filename
+            preserve_metadata: Also copy permissions and timestamps (shutil.copy2)
 
         Returns:
             str: New centralized path if successful, None otherwise
@@ -467,42 +642,113 @@ class PathManager:
             return source_path  # Return original path if centralization disabled
 
         try:
-            source = Path(source_path)
-            if not source.exists():
+            if not os.path.exists(source_path):
                 logger.warning(f"Source resource not found: {source_path}")
                 return None
 
-            # Determine target directory based on resource type
-            if resource_type == 'uid':
-                target_dir = self.get_uid_storage_path()
-            elif resource_type == 'reference':
-                target_dir = self.get_reference_images_path()
-            elif resource_type == '3d_objects':
-                target_dir = self.get_3d_objects_path()
-            elif resource_type == 'screenshot':
-                target_dir = self.get_unreal_screenshots_path() or self.get_temp_processing_path()
-            elif resource_type == 'temp':
-                target_dir = self.get_temp_processing_path()
-            else:
-                logger.error(f"Unknown resource type: {resource_type}")
+            target_dir = self._get_resource_target_dir(resource_type)
+            if target_dir is None:
                 return None
 
-            # Determine target filename
-            target_filename = target_name or source.name
-            target_path = Path(target_dir) / target_filename
-
-            # Copy file if it doesn't already exist
-            if not target_path.exists():
-                import shutil
-                shutil.copy2(source, target_path)
-                logger.info(f"Copied resource {resource_type}: {source_path} → {target_path}")
-
-            return str(target_path)
+            return self._copy_resource_file(source_path, target_dir, target_name, resource_type, preserve_metadata)
 
         except Exception as e:
             logger.error(f"Failed to copy resource {source_path}: {e}")
             return None
 
+    def copy_resources_to_centralized_batch(self, source_paths: Iterable[str], resource_type: str,
+                                            preserve_metadata: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Copy several resources of one type to centralized storage.
+
+        The target directory is resolved once for the whole batch. A directory
+        in source_paths contributes the files directly inside it.
+
+        Args:
+            source_paths: Original resource files and/or directories
+            resource_type: Type of resource ('uid', 'reference', 'screenshot', 'temp')
+            preserve_metadata: Also copy permissions and timestamps (shutil.copy2)
+
+        Returns:
+            Dict mapping each source file to its centralized path (None on failure)
+        """
+        if not self.config.copy_on_access or not self.config.enable_centralized_paths:
+            return {source_path: source_path for source_path in source_paths}
+
+        results: Dict[str, Optional[str]] = {}
+        try:
+            target_dir = self._get_resource_target_dir(resource_type)
+        except Exception as e:
+            logger.error(f"Failed to resolve target directory for {resource_type}: {e}")
+            target_dir = None
+
+        for source_path in source_paths:
+            try:
+                if os.path.isdir(source_path):
+                    with os.scandir(source_path) as it:
+                        files = [entry.path for entry in it if entry.is_file()]
+                elif os.path.exists(source_path):
+                    files = [source_path]
+                else:
+                    logger.warning(f"Source resource not found: {source_path}")
+                    results[source_path] = None
+                    continue
+            except OSError as e:
+                # Unreadable, or removed between the checks
+                logger.error(f"Failed to scan resource {source_path}: {e}")
+                results[source_path] = None
+                continue
+
+            for file_path in files:
+                if target_dir is None:
+                    results[file_path] = None
+                    continue
+                try:
+                    results[file_path] = self._copy_resource_file(
+                        file_path, target_dir, None, resource_type, preserve_metadata
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to copy resource {file_path}: {e}")
+                    results[file_path] = None
+
+        return results
+
+    def _get_resource_target_dir(self, resource_type: str) -> Optional[str]:
+        """Centralized directory for a resource type, or None if unknown."""
+        if resource_type == 'uid':
+            return self.get_uid_storage_path()
+        elif resource_type == 'reference':
+            return self.get_reference_images_path()
+        elif resource_type == '3d_objects':
+            return self.get_3d_objects_path()
+        elif resource_type == 'screenshot':
+            return self.get_unreal_screenshots_path() or self.get_temp_processing_path()
+        elif resource_type == 'temp':
+            return self.get_temp_processing_path()
+
+        logger.error(f"Unknown resource type: {resource_type}")
+        return None
+
+    def _copy_resource_file(self, source_path: str, target_dir: str, target_name: Optional[str],
+                            resource_type: str, preserve_metadata: bool) -> str:
+        """Copy one file into target_dir unless it is already there."""
+        # Determine target filename
+        target_filename = target_name or os.path.basename(source_path)
+        target_path = os.path.join(target_dir, target_filename)
+
+        # Copy file if it doesn't already exist (this also covers copying a
+        # file onto itself); copyfile uses the kernel's fast copy paths and
+        # skips the chmod/utime that copy2 adds
+        if not os.path.exists(target_path):
+            if preserve_metadata:
+                shutil.copy2(source_path, target_path)
+            else:
+                shutil.copyfile(source_path, target_path)
+            self._stat_cache.invalidate(target_path)
+            logger.info(f"Copied resource {resource_type}: {source_path} → {target_path}")
+
+        return target_path
+
     def cleanup_temp_resources(self, max_age_hours: int = 24) -> bool:
         """
         Clean up temporary resources based on age.
@@ -521,7 +767,6 @@ class PathManager:
             if not temp_path.exists():
                 return True  # Nothing to clean
 
-            import time
             current_time = time.time()
             max_age_seconds = max_age_hours * 3600
 
@@ -531,6 +776,7 @@ class PathManager:
                     file_age = current_time - file_path.stat().st_mtime
                     if file_age > max_age_seconds:
                         file_path.unlink()
+                        self._stat_cache.invalidate(str(file_path))
                         cleaned_count += 1
 
             logger.info(f"Cleaned up {cleaned_count} temporary files older than {max_age_hours} hours")
@@ -560,8 +806,7 @@ class PathManager:
                 self.get_temp_processing_path()
             ]
 
-            for directory in directories:
-                Path(directory).mkdir(parents=True, exist_ok=True)
+            self._ensure_dirs(directories)
 
             logger.info("Resource directory synchronization completed")
             return True
@@ -586,9 +831,8 @@ class PathManager:
                 self.get_logs_directory()
             ]
 
-            for directory in directories:
-                Path(directory).mkdir(parents=True, exist_ok=True)
-                logger.debug(f"Ensured directory exists: {directory}")
+            self._ensure_dirs(directories)
+            logger.debug("Ensured directories exist: %s", directories)
 
             logger.info("MegaMelange directory structure ensured")
             return True
@@ -620,8 +864,6 @@ class PathManager:
             AppError: If unable to determine path or save file
         """
         try:
-            from core.errors import AppError, ErrorCategory
-
             # Get generated images directory path
             generated_dir = self.get_generated_images_path()
             if not generated_dir:
@@ -633,21 +875,19 @@ class PathManager:
                 )
 
             # Create directory if needed
-            generated_path = Path(generated_dir)
-            generated_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(generated_dir)
 
             # Save file
-            file_path = generated_path / filename
+            file_path = os.path.join(generated_dir, filename)
             with open(file_path, 'wb') as f:
                 f.write(image_data)
 
             logger.info(f"Generated image saved: {filename} (source: {source}, size: {len(image_data)} bytes)")
-            return str(file_path)
+            return file_path
 
         except AppError:
             raise  # Re-raise AppError as-is
         except Exception as e:
-            from core.errors import AppError, ErrorCategory
             logger.error(f"Failed to save generated image: {e}")
             raise AppError(
                 code="IMG_SAVE_FAILED",
@@ -663,55 +903,50 @@ class PathManager:
         Returns:
             Dict containing all path information
         """
+        cached = self._path_info_cache
+        if cached is not None and time.monotonic() < cached[1]:
+            return self._copy_path_info(cached[0])
+
         try:
             unreal_path = self.get_unreal_project_path()
             megamelange_path = self.get_megamelange_base_path()
+            stat_cache = self._stat_cache
+
+            directories = {
+                'sessions': self.get_sessions_directory(),
+                'active': self.get_active_sessions_directory(),
+                'archived': self.get_archived_sessions_directory(),
+                'metadata': self.get_metadata_directory(),
+                'logs': self.get_logs_directory()
+            }
+            resource_directories = {
+                'data_storage': self.get_data_storage_path(),
+                'uid_storage': self.get_uid_storage_path(),
+                'reference_images': self.get_reference_images_path(),
+                '3d_objects': self.get_3d_objects_path(),
+                'temp_processing': self.get_temp_processing_path(),
+                'unreal_saved': self.get_unreal_saved_directory(),
+                'unreal_screenshots': self.get_unreal_screenshots_path(),
+                'unreal_styled': self.get_unreal_styled_images_path()
+            }
 
-            return {
+            info = {
                 'unreal_project_path': unreal_path,
                 'megamelange_base_path': megamelange_path,
                 'path_derivation': 'from_unreal_project' if unreal_path else 'fallback',
-                'directories': {
-                    'sessions': self.get_sessions_directory(),
-                    'active': self.get_active_sessions_directory(),
-                    'archived': self.get_archived_sessions_directory(),
-                    'metadata': self.get_metadata_directory(),
-                    'logs': self.get_logs_directory()
-                },
-                'resource_directories': {
-                    'data_storage': self.get_data_storage_path(),
-                    'uid_storage': self.get_uid_storage_path(),
-                    'reference_images': self.get_reference_images_path(),
-                    '3d_objects': self.get_3d_objects_path(),
-                    'temp_processing': self.get_temp_processing_path(),
-                    'unreal_saved': self.get_unreal_saved_directory(),
-                    'unreal_screenshots': self.get_unreal_screenshots_path(),
-                    'unreal_styled': self.get_unreal_styled_images_path()
-                },
+                'directories': directories,
+                'resource_directories': resource_directories,
                 'key_files': {
                     'session_index': self.get_session_index_file(),
                     'stats': self.get_stats_file()
                 },
                 'validation': {
                     'unreal_path_valid': self.validate_unreal_project_path(unreal_path) if unreal_path else False,
-                    'megamelange_path_exists': Path(megamelange_path).exists(),
-                    'directories_exist': all(Path(d).exists() for d in [
-                        self.get_sessions_directory(),
-                        self.get_active_sessions_directory(),
-                        self.get_archived_sessions_directory(),
-                        self.get_metadata_directory(),
-                        self.get_logs_directory()
-                    ]),
-                    'resource_directories_exist': all(Path(d).exists() if d else True for d in [
-                        self.get_data_storage_path(),
-                        self.get_uid_storage_path(),
-                        self.get_reference_images_path(),
-                        self.get_3d_objects_path(),
-                        self.get_temp_processing_path(),
-                        self.get_unreal_saved_directory(),
-                        self.get_unreal_screenshots_path(),
-                        self.get_unreal_styled_images_path()
-                    ])
+                    'megamelange_path_exists': stat_cache.get_exists(megamelange_path),
+                    'directories_exist': all(stat_cache.get_exists(d) for d in directories.values()),
+                    'resource_directories_exist': all(
+                        stat_cache.get_exists(d) if d else True for d in resource_directories.values()
+                    )
                 },
                 'config': {
                     'fallback_enabled': self.config.fallback_enabled,
@@ -726,13 +961,70 @@ class PathManager:
                 }
             }
 
+            self._path_info_cache = (info, time.monotonic() + self.config.path_info_ttl_seconds)
+            return self._copy_path_info(info)
+
         except Exception as e:
             logger.error(f"Error getting path info: {e}")
             return {'error': str(e)}
 
+    @staticmethod
+    def _copy_path_info(info: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy cached path info so callers cannot mutate the cache."""
+        return {key: dict(value) if isinstance(value, dict) else value for key, value in info.items()}
+
+    def _ensure_dir(self, path: str):
+        """Create a directory (and parents) and drop stale stat cache entries."""
+        if path in self._dirs_ensured:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._stat_cache.invalidate(path)
+        self._mark_dir_ensured(path)
+        self._path_info_cache = None
+
+    def _ensure_dirs(self, paths: Iterable[str]):
+        """
+        Create several directories in one deduplicated pass.
+
+        Paths already created by this instance are skipped, and a path that
+        is an ancestor of another requested path is left to that path's
+        makedirs, so shared parents are only created once.
+        """
+        ensured = self._dirs_ensured
+        pending = {path for path in paths if path and path not in ensured}
+        if not pending:
+            return
+
+        implied = set()
+        for path in pending:
+            parent = os.path.dirname(path)
+            while parent and parent != path and parent not in implied:
+                implied.add(parent)
+                path, parent = parent, os.path.dirname(parent)
+
+        for path in sorted(pending - implied, key=len):
+            os.makedirs(path, exist_ok=True)
+            self._stat_cache.invalidate(path)
+            self._mark_dir_ensured(path)
+        self._path_info_cache = None
+
+    def _mark_dir_ensured(self, path: str):
+        """Record a created directory and its ancestors."""
+        ensured = self._dirs_ensured
+        while path and path not in ensured:
+            ensured.add(path)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+
     def clear_cache(self):
         """Clear the internal path cache to force re-resolution."""
         self._cached_paths.clear()
+        self._dirs_ensured.clear()
+        self._session_dirs.clear()
+        self._stat_cache.invalidate()
+        self._path_info_cache = None
         logger.debug("Path cache cleared")
 
     def health_check(self) -> bool:
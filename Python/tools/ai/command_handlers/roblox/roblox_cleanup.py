@@ -47,7 +47,7 @@ class RobloxCleanupManager:
 
             existing_downloads = []
 
-            for uid, mapping in all_mappings.items():
+            for uid, mapping in list(all_mappings.items()):
                 # Only check 3D object mappings
                 if mapping.get('type') != '3d_object':
                     continue
@@ -144,9 +144,7 @@ class RobloxCleanupManager:
                     logger.info(f"Cleaned up files for UID: {uid}")
 
                 # Remove UID mapping
-                if uid in self.uid_manager.get_all_mappings():
-                    del self.uid_manager._uid_mappings[uid]
-                    self.uid_manager._save_state()
+                if self.uid_manager.delete_mapping(uid):
                     logger.info(f"Removed UID mapping: {uid}")
 
                 cleanup_count += 1
@@ -299,8 +299,7 @@ class RobloxFBXConverterHandler(BaseCommandHandler):
         Raises:
             RobloxError: If UID not found
         """
-        all_mappings = self.uid_manager.get_all_mappings()
-        mapping = all_mappings.get(obj_uid)
+        mapping = self.uid_manager.get_mapping(obj_uid)
 
         if not mapping:
             raise RobloxError(
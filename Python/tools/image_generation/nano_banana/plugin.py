@@ -5,7 +5,7 @@ Provides separate handlers for I2I and T2I operations (fal.ai style).
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any
 from core import BasePlugin, ToolCapability, ToolStatus, ToolMetadata, CommandResult
 from .handlers.i2i_handler import NanoBananaImageToImageHandler
 from .handlers.t2i_handler import NanaBananaTextToImageHandler
@@ -17,9 +17,15 @@ logger = logging.getLogger(__name__)
 class Plugin(BasePlugin):
     """Nano Banana tool plugin for image generation and editing."""
 
+    SUPPORTED_COMMANDS = (
+        "nano_banana_text_to_image",
+        "nano_banana_image_to_image"
+    )
+
     def __init__(self):
         super().__init__()
         self._handlers = []  # Changed from _handler to _handlers (list)
+        self._handler_map = {}  # command_type -> handler
 
     def get_metadata(self) -> ToolMetadata:
         """Return Nano Banana tool metadata."""
@@ -46,6 +52,11 @@ class Plugin(BasePlugin):
                 NanoBananaImageToImageHandler(),
                 NanaBananaTextToImageHandler()
             ]
+            self._handler_map = {
+                command: handler
+                for handler in self._handlers
+                for command in handler.get_supported_commands()
+            }
             self.set_status(ToolStatus.AVAILABLE)
             logger.info("Nano Banana plugin initialized with I2I and T2I handlers")
             return True
@@ -57,6 +68,7 @@ class Plugin(BasePlugin):
     def shutdown(self) -> bool:
         """Shutdown the plugin (no cleanup needed currently)."""
         self._handlers = []
+        self._handler_map = {}
         self.set_status(ToolStatus.UNAVAILABLE)
         logger.info("Nano Banana plugin shutdown")
         return True
@@ -73,24 +85,9 @@ class Plugin(BasePlugin):
         except Exception:
             return ToolStatus.ERROR
 
-    def get_supported_commands(self) -> List[str]:
-        """Return list of supported Nano Banana commands."""
-        if self._handlers:
-            commands = []
-            for handler in self._handlers:
-                commands.extend(handler.get_supported_commands())
-            return commands
-        return [
-            "nano_banana_text_to_image",
-            "nano_banana_image_to_image"
-        ]
-
     def _get_handler_for_command(self, command_type: str):
         """Find the appropriate handler for a given command type."""
-        for handler in self._handlers:
-            if command_type in handler.get_supported_commands():
-                return handler
-        return None
+        return self._handler_map.get(command_type)
 
     def validate_command(self, command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate Nano Banana command parameters."""
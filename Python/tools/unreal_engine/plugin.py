@@ -6,7 +6,7 @@ to integrate with the plugin system.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any
 from core import BasePlugin, ToolCapability, ToolStatus, ToolMetadata, CommandResult
 
 # Import internal handlers (moved from command_handlers to plugin)
@@ -24,9 +24,27 @@ logger = logging.getLogger(__name__)
 class Plugin(BasePlugin):
     """Unreal Engine tool plugin for 3D scene management and rendering."""
 
+    SUPPORTED_COMMANDS = (
+        # ActorCommandHandler
+        "get_actors_in_level", "create_actor", "delete_actor",
+        "set_actor_transform", "get_actor_properties",
+        # LightCommandHandler
+        "create_mm_control_light", "get_mm_control_lights",
+        "update_mm_control_light", "delete_mm_control_light",
+        # UDSCommandHandler
+        "get_ultra_dynamic_sky", "set_time_of_day", "set_color_temperature",
+        # CesiumCommandHandler
+        "set_cesium_latitude_longitude", "get_cesium_properties",
+        # ScreenshotCommandHandler
+        "take_screenshot",
+        # Object3DImportHandler
+        "import_object3d_by_uid",
+    )
+
     def __init__(self):
         super().__init__()
         self._handlers = []
+        self._handler_map = {}  # command_type -> handler
         self._tcp_connection = None  # Will be set externally
 
     def get_metadata(self) -> ToolMetadata:
@@ -64,6 +82,11 @@ class Plugin(BasePlugin):
                 ScreenshotCommandHandler(),
                 Object3DImportHandler()
             ]
+            self._handler_map = {
+                command: handler
+                for handler in self._handlers
+                for command in handler.get_supported_commands()
+            }
 
             self.set_status(ToolStatus.AVAILABLE)
             logger.info("Unreal Engine plugin initialized successfully")
@@ -76,6 +99,7 @@ class Plugin(BasePlugin):
     def shutdown(self) -> bool:
         """Shutdown the plugin and close TCP connection if active."""
         self._handlers = []
+        self._handler_map = {}
         self._tcp_connection = None
         self.set_status(ToolStatus.UNAVAILABLE)
         logger.info("Unreal Engine plugin shutdown")
@@ -106,13 +130,6 @@ class Plugin(BasePlugin):
         else:
             self.set_status(ToolStatus.UNAVAILABLE)
 
-    def get_supported_commands(self) -> List[str]:
-        """Return list of all supported Unreal Engine commands."""
-        all_commands = []
-        for handler in self._handlers:
-            all_commands.extend(handler.get_supported_commands())
-        return all_commands
-
     def validate_command(self, command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate Unreal Engine command parameters."""
         if not self._handlers:
@@ -189,7 +206,4 @@ class Plugin(BasePlugin):
 
     def _get_handler_for_command(self, command_type: str):
         """Find the appropriate handler for a given command type."""
-        for handler in self._handlers:
-            if command_type in handler.get_supported_commands():
-                return handler
-        return None
+        return self._handler_map.get(command_type)
@@ -5,7 +5,7 @@ Wraps Google Veo-3 video generation handler to integrate with the plugin system.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any
 from core import BasePlugin, ToolCapability, ToolStatus, ToolMetadata, CommandResult
 
 # Import internal handler
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 class Plugin(BasePlugin):
     """Video Generation tool plugin using Google Veo-3."""
 
+    SUPPORTED_COMMANDS = ("generate_video_from_image",)
+
     def __init__(self):
         super().__init__()
         self._handler = None
@@ -81,12 +83,6 @@ class Plugin(BasePlugin):
         except Exception:
             return ToolStatus.ERROR
 
-    def get_supported_commands(self) -> List[str]:
-        """Return list of supported video generation commands."""
-        if not self._handler:
-            return []
-        return self._handler.get_supported_commands()
-
     def validate_command(self, command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate video generation command parameters."""
         if not self._handler:
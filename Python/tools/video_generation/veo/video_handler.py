@@ -23,7 +23,7 @@ from core.schemas.video import (
     extract_parent_filename,
     generate_video_filename
 )
-from core.resources.uid_manager import generate_image_uid, generate_video_uid, add_uid_mapping
+from core.resources.uid_manager import generate_image_uid, generate_video_uid, add_uid_mappings
 from core.errors import (
     video_not_found, video_generation_failed, video_api_unavailable,
     invalid_video_duration, AppError, ErrorCategory
@@ -290,39 +290,40 @@ class VideoGenerationHandler(BaseCommandHandler):
                 else:  # 1080p
                     video_width, video_height = (1920, 1080) if aspect_ratio == "16:9" else (1080, 1920)
 
-                # Add mappings for both screenshot and video
-                # 1. Original screenshot
-                add_uid_mapping(
-                    parent_uid,
-                    'image',
-                    Path(latest_screenshot).name,
-                    session_id=session_id,
-                    metadata={
-                        'width': screenshot_metadata.get('width', 0),
-                        'height': screenshot_metadata.get('height', 0),
-                        'file_path': str(latest_screenshot),
-                        'video_source': True
+                # Add mappings for both screenshot and video in one batch
+                add_uid_mappings([
+                    # 1. Original screenshot
+                    {
+                        'uid': parent_uid,
+                        'content_type': 'image',
+                        'filename': Path(latest_screenshot).name,
+                        'session_id': session_id,
+                        'metadata': {
+                            'width': screenshot_metadata.get('width', 0),
+                            'height': screenshot_metadata.get('height', 0),
+                            'file_path': str(latest_screenshot),
+                            'video_source': True
+                        }
+                    },
+                    # 2. Generated video
+                    {
+                        'uid': video_uid,
+                        'content_type': 'video',
+                        'filename': filename,
+                        'parent_uid': parent_uid,
+                        'session_id': session_id,
+                        'metadata': {
+                            'width': video_width,
+                            'height': video_height,
+                            'file_path': video_path,
+                            'duration_seconds': video_metadata['duration_seconds'],
+                            'prompt': prompt,
+                            'aspect_ratio': aspect_ratio,
+                            'resolution': resolution,
+                            'cost': video_metadata['cost']
+                        }
                     }
-                )
-
-                # 2. Generated video
-                add_uid_mapping(
-                    video_uid,
-                    'video',
-                    filename,
-                    parent_uid=parent_uid,
-                    session_id=session_id,
-                    metadata={
-                        'width': video_width,
-                        'height': video_height,
-                        'file_path': video_path,
-                        'duration_seconds': video_metadata['duration_seconds'],
-                        'prompt': prompt,
-                        'aspect_ratio': aspect_ratio,
-                        'resolution': resolution,
-                        'cost': video_metadata['cost']
-                    }
-                )
+                ])
 
                 # Build standardized video response
                 return build_video_transform_response(